@@ -0,0 +1,176 @@
+"""
+Headless Monte Carlo batch runner for the ALIEN: MUTHUR airlock puzzle
+
+Simulates thousands of airlock sessions with scripted bulkhead strategies.
+Each session steps an AirlockSim on its virtual 60 Hz clock with no
+rendering, and sessions are spread across a multiprocessing pool.
+
+Usage:
+    python airlock_batch.py --sessions 2000 --workers 4 --seed 1
+"""
+
+import argparse
+import multiprocessing
+import random
+import statistics
+import time
+from airlock_sim import AirlockSim, CARGO_BULKHEADS, TICKS_PER_SECOND
+
+MAX_SESSION_TICKS = 5 * 60 * TICKS_PER_SECOND  # Give up after 5 minutes
+COMMAND_LATENCY = 90  # Ticks a player needs to type one command
+CHUNK_SIZE = 50  # Sessions per pool task
+
+
+# Strategies are generators that yield one terminal command at a time, or
+# None to wait a tick. A successful OPEN AIRLOCK ends the session, so any
+# code after it only runs when the alien slipped out of the cargo bay.
+
+def strategy_idle(sim):
+    """Never touch the terminal - measures raw time-to-bridge"""
+    while True:
+        yield None
+
+def strategy_trap(sim):
+    """Wait for the alien to wander into cargo, then seal and vent"""
+    while True:
+        while not sim.alien_in_cargo():
+            yield None
+        for bh in CARGO_BULKHEADS:
+            yield f"SEAL {bh}"
+        yield "OPEN AIRLOCK"
+        for bh in CARGO_BULKHEADS:
+            yield f"OPEN {bh}"
+
+def strategy_guard_then_trap(sim):
+    """Seal B1 and B4 as MUTHUR advises, then trap the alien in cargo"""
+    yield "SEAL B1"
+    yield "SEAL B4"
+    yield from strategy_trap(sim)
+
+def strategy_funnel(sim):
+    """Guard the bridge, leave only B10 open into cargo, close it behind the alien"""
+    for cmd in ("SEAL B1", "SEAL B4", "SEAL B8", "SEAL B9"):
+        yield cmd
+    while True:
+        while not sim.alien_in_cargo():
+            yield None
+        yield "SEAL B10"
+        yield "OPEN AIRLOCK"
+        yield "OPEN B10"
+
+def strategy_solver(sim):
+    """Play the schedule found by airlock_solver"""
+    from airlock_solver import solve
+    yield from solve().strategy(sim)
+
+STRATEGIES = {
+    'idle': strategy_idle,
+    'trap': strategy_trap,
+    'guard_then_trap': strategy_guard_then_trap,
+    'funnel': strategy_funnel,
+    'solver': strategy_solver,
+}
+
+
+def run_session(strategy_name, rng):
+    """Run one session to completion
+
+    Returns:
+        (outcome, ticks) where outcome is 'victory', 'failure' or 'timeout'
+    """
+    sim = AirlockSim(rng=rng)
+    strategy = STRATEGIES[strategy_name](sim)
+    cooldown = 0
+
+    while sim.ticks < MAX_SESSION_TICKS:
+        if cooldown > 0:
+            cooldown -= 1
+        else:
+            cmd = next(strategy)
+            if cmd:
+                sim.command(cmd)
+                if sim.game_won:
+                    return 'victory', sim.ticks
+                cooldown = COMMAND_LATENCY
+
+        sim.tick()
+        if sim.game_over:
+            return 'failure', sim.ticks
+
+    return 'timeout', sim.ticks
+
+
+def run_chunk(task):
+    """Pool worker: run a chunk of sessions under its own seed"""
+    strategy_name, seed, count = task
+    rng = random.Random(seed)
+    return [run_session(strategy_name, rng) for _ in range(count)]
+
+
+def run_batch(strategy_name, sessions, workers=None, seed=0):
+    """Simulate sessions across a process pool
+
+    Returns:
+        (results, elapsed_seconds)
+    """
+    tasks = []
+    remaining = sessions
+    chunk_index = 0
+    while remaining > 0:
+        count = min(CHUNK_SIZE, remaining)
+        tasks.append((strategy_name, seed * 1000003 + chunk_index, count))
+        remaining -= count
+        chunk_index += 1
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        results = [r for chunk in pool.imap_unordered(run_chunk, tasks) for r in chunk]
+    return results, time.perf_counter() - start
+
+
+def format_distribution(ticks):
+    """Summarise a list of tick counts as seconds percentiles"""
+    if not ticks:
+        return "n/a"
+    seconds = sorted(t / TICKS_PER_SECOND for t in ticks)
+    if len(seconds) > 1:
+        p10, p50, p90 = (statistics.quantiles(seconds, n=10)[i] for i in (0, 4, 8))
+    else:
+        p10 = p50 = p90 = seconds[0]
+    return (f"min {seconds[0]:.1f}s  p10 {p10:.1f}s  median {p50:.1f}s  "
+            f"p90 {p90:.1f}s  max {seconds[-1]:.1f}s")
+
+
+def print_report(strategy_name, results, elapsed):
+    total = len(results)
+    wins = [t for outcome, t in results if outcome == 'victory']
+    losses = [t for outcome, t in results if outcome == 'failure']
+    timeouts = total - len(wins) - len(losses)
+
+    print(f"Strategy: {strategy_name}")
+    print(f"  Sessions:       {total}")
+    print(f"  Win rate:       {len(wins) / total:.1%}")
+    print(f"  Loss rate:      {len(losses) / total:.1%}")
+    print(f"  Timeouts:       {timeouts}")
+    print(f"  Time-to-bridge: {format_distribution(losses)}")
+    print(f"  Time-to-win:    {format_distribution(wins)}")
+    print(f"  Throughput:     {total / elapsed:.0f} sims/s")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo airlock difficulty runner")
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Pool size (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), action="append",
+                        help="Strategy to run (repeatable, default: all)")
+    args = parser.parse_args()
+
+    for strategy_name in args.strategy or list(STRATEGIES):
+        results, elapsed = run_batch(strategy_name, args.sessions, args.workers, args.seed)
+        print_report(strategy_name, results, elapsed)
+
+if __name__ == "__main__":
+    main()
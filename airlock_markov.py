@@ -0,0 +1,327 @@
+"""
+Markov-chain difficulty estimator for the ALIEN: MUTHUR airlock puzzle
+
+Alien.choose_destination and Alien.find_path_bfs define a stochastic walk
+over the room nodes of the ship graph. For a fixed set of sealed bulkheads
+this module builds the transition matrix of that walk (one state per room
+node, for that seal state) and computes hitting probabilities, expected
+hitting times and hitting-time distributions with NumPy, without running
+any simulation.
+
+The chain is not over the joint (node, seal-state) space. Seals change only
+when the player types a command, so there is no transition law between
+seal states to put in a matrix. Each seal state gets its own chain over the
+room nodes, with the seals as a fixed parameter: AirlockChain(sealed) is one
+block of what would be a block-diagonal joint matrix, and --all-layouts
+walks all 1024 of them. Every estimate therefore assumes the seals stay as
+they are for the rest of the walk. A live estimate has to be recomputed
+(threat_estimate caches per seal state) whenever the player seals or opens
+a bulkhead.
+
+Modelling notes:
+    - States are the alien's decision points: the room nodes it stands on
+      when it enters the 'choosing' state.
+    - The recency weighting of wandering is approximated as uniform.
+    - Aggression is held at a fixed level (it ramps to 2.0 in ~33 seconds).
+    - A walk ends the moment its path touches an absorbing node, so the
+      alien passing through the bridge counts as reaching it.
+
+Usage:
+    python airlock_markov.py --seal B1 --seal B4
+    python airlock_markov.py --all-layouts
+"""
+
+import argparse
+import itertools
+import math
+import time
+from functools import lru_cache
+import numpy as np
+from airlock_sim import Alien, build_ship, PLAYER_POS, TICKS_PER_SECOND
+
+CARGO_NODES = ('cargo_left', 'cargo_center', 'cargo_right')
+
+# Mean speed multipliers from Alien.update (sin terms average out)
+HUNTING_SPEED = 1.8
+WANDER_SPEED = 0.8 * 0.95 + 1.5 * 0.05
+
+
+class AirlockChain:
+    """Decision-point Markov chain of the alien over room nodes, for one
+    fixed seal state (the seals are a parameter, not part of the state)"""
+    def __init__(self, sealed=(), aggression=2.0):
+        self.sealed = frozenset(sealed)
+        self.aggression = aggression
+
+        nodes, self.bulkheads, self.all_nodes = build_ship()
+        for name in self.sealed:
+            self.bulkheads[name].sealed = True
+
+        self.states = list(nodes)
+        self.index = {key: i for i, key in enumerate(self.states)}
+        self.key_of = {node: key for key, node in nodes.items()}
+        self.nodes = nodes
+        self.probe = Alien(nodes['reactor'], nodes['bridge'], clock=lambda: 0)
+        self.probe.aggression_level = aggression
+
+    def is_hunting(self, node):
+        radius = 350 + self.aggression * 50
+        return math.hypot(node.x - PLAYER_POS[0], node.y - PLAYER_POS[1]) < radius
+
+    def find_path(self, start, target):
+        self.probe.current_node = start
+        self.probe.x, self.probe.y = float(start.x), float(start.y)
+        return self.probe.find_path_bfs(target, self.bulkheads)
+
+    def destination_weights(self, node, hunting):
+        """Destination distribution of choose_destination from a node"""
+        valid = [n for n in self.all_nodes if n.name != 'waypoint' and n != node]
+        if not hunting:
+            return [(1.0 / len(valid), n) for n in valid] if valid else []
+
+        nearby = [n for n in valid if math.hypot(n.x - node.x, n.y - node.y) < 300]
+        if not nearby:
+            return [(1.0, self.probe.bridge_node)]
+        weights = [(0.8, self.probe.bridge_node)]
+        weights.extend((0.2 / len(nearby), n) for n in nearby)
+        return weights
+
+    def travel(self, start, path, absorbing):
+        """Walk a path, stopping early at an absorbing node
+
+        Returns:
+            (end_node, ticks, absorbed)
+        """
+        base_speed = self.probe.move_speed * (1.0 + self.aggression * 0.3)
+        ticks = 0.0
+        here = start
+        for step in path:
+            multiplier = HUNTING_SPEED if self.is_hunting(here) else WANDER_SPEED
+            ticks += math.hypot(step.x - here.x, step.y - here.y) / (base_speed * multiplier) + 1
+            here = step
+            if step.name != 'waypoint' and self.key_of.get(step) in absorbing:
+                return here, ticks, True
+        return here, ticks, False
+
+    def transitions(self, absorbing):
+        """Enumerate transitions from every non-absorbing state
+
+        Returns:
+            List of (from_index, to_index, probability, ticks)
+        """
+        a = self.aggression
+        blocked_ticks = (150 - int(a * 30)) + (30 + int(30 / (a + 1))) + 2
+        result = []
+
+        for key in self.states:
+            if key in absorbing:
+                continue
+            node = self.nodes[key]
+            i = self.index[key]
+            hunting = self.is_hunting(node)
+            outcomes = []
+
+            for p, dest in self.destination_weights(node, hunting):
+                path = self.find_path(node, dest)
+                if path:
+                    outcomes.append((p, path))
+                elif hunting:
+                    # Bridge unreachable while hunting: fall back to wandering
+                    for q, wander in self.destination_weights(node, False):
+                        wander_path = self.find_path(node, wander)
+                        outcomes.append((p * q, wander_path))
+                else:
+                    outcomes.append((p, None))
+
+            for p, path in outcomes:
+                if not path:
+                    result.append((i, i, p, blocked_ticks))
+                    continue
+                end, ticks, absorbed = self.travel(node, path, absorbing)
+                if not absorbed:
+                    idle = 17.5 if self.is_hunting(end) else 40.0
+                    ticks += idle + 2
+                result.append((i, self.index[self.key_of[end]], p, ticks + 1))
+        return result
+
+    def matrix(self, absorbing=('bridge',)):
+        """Transition matrix and mean step duration (ticks) per state"""
+        n = len(self.states)
+        P = np.zeros((n, n))
+        mean_ticks = np.zeros(n)
+        for i, j, p, ticks in self.transitions(set(absorbing)):
+            P[i, j] += p
+            mean_ticks[i] += p * ticks
+        for key in absorbing:
+            P[self.index[key], self.index[key]] = 1.0
+        return P, mean_ticks
+
+    def hitting(self, targets, avoid=()):
+        """Probability of reaching targets before avoid, and mean ticks to do so
+
+        Returns:
+            Dict of state key to (probability, expected_ticks_given_hit)
+        """
+        absorbing = set(targets) | set(avoid) | {'bridge'}
+        transitions = self.transitions(absorbing)
+        n = len(self.states)
+        target_idx = [self.index[k] for k in targets]
+        transient = [i for i, k in enumerate(self.states) if k not in absorbing]
+        pos = {s: r for r, s in enumerate(transient)}
+        m = len(transient)
+
+        Q = np.zeros((m, m))
+        b = np.zeros(m)
+        for i, j, p, _ in transitions:
+            if j in pos:
+                Q[pos[i], pos[j]] += p
+            elif j in target_idx:
+                b[pos[i]] += p
+
+        # x = P(hit targets first); y = E[T * 1{hit}]
+        lhs = np.eye(m) - Q
+        x = np.linalg.lstsq(lhs, b, rcond=None)[0] if m else b
+        x_full = np.zeros(n)
+        x_full[target_idx] = 1.0
+        x_full[transient] = x
+
+        c = np.zeros(m)
+        for i, j, p, ticks in transitions:
+            c[pos[i]] += p * ticks * x_full[j]
+        y = np.linalg.lstsq(lhs, c, rcond=None)[0] if m else c
+
+        result = {k: (1.0, 0.0) for k in targets}
+        for k in avoid:
+            if k not in targets:
+                result[k] = (0.0, math.inf)
+        for s, r in pos.items():
+            prob = float(np.clip(x[r], 0.0, 1.0))
+            result[self.states[s]] = (prob, float(y[r] / x[r]) if x[r] > 1e-12 else math.inf)
+        return result
+
+    def hitting_time_distribution(self, targets, avoid=(), start='reactor',
+                                  horizon_seconds=300, bucket_ticks=15):
+        """Distribution of the time to first reach targets from start
+
+        Returns:
+            (bucket_start_seconds, probability_mass) arrays; the mass sums to
+            the probability of hitting within the horizon
+        """
+        absorbing = set(targets) | set(avoid) | {'bridge'}
+        n = len(self.states)
+        buckets = int(horizon_seconds * TICKS_PER_SECOND / bucket_ticks)
+
+        by_delay = {}
+        for i, j, p, ticks in self.transitions(absorbing):
+            d = max(1, int(round(ticks / bucket_ticks)))
+            by_delay.setdefault(d, np.zeros((n, n)))[i, j] += p
+        delays = sorted(by_delay)
+        stacked = np.stack([by_delay[d] for d in delays])
+
+        target_idx = [self.index[k] for k in targets]
+        mass = np.zeros((buckets + 1, n))
+        mass[0, self.index[start]] = 1.0
+        hits = np.zeros(buckets + 1)
+        for t in range(1, buckets + 1):
+            valid = [k for k, d in enumerate(delays) if d <= t]
+            if valid:
+                sources = mass[[t - delays[k] for k in valid]]
+                mass[t] = np.einsum('kn,knm->m', sources, stacked[valid])
+            hits[t] = mass[t, target_idx].sum()
+        return np.arange(buckets + 1) * bucket_ticks / TICKS_PER_SECOND, hits
+
+
+@lru_cache(maxsize=1024)
+def threat_estimate(sealed=frozenset(), alien_node='reactor', aggression=2.0):
+    """Cached live threat estimate for a seal state
+
+    Returns:
+        (probability the alien reaches the bridge before the cargo bay,
+         expected seconds to the bridge, or inf if it cannot get there)
+    """
+    chain = AirlockChain(sealed, aggression)
+    if alien_node in CARGO_NODES:
+        race = 0.0
+    else:
+        race = 1.0 - chain.hitting(CARGO_NODES, avoid=('bridge',))[alien_node][0]
+    prob, ticks = chain.hitting(('bridge',))[alien_node]
+    seconds = ticks / TICKS_PER_SECOND if prob > 0 else math.inf
+    return race, seconds
+
+
+def percentile(times, pmf, q):
+    """Time by which a fraction q of all hitting mass has arrived"""
+    total = pmf.sum()
+    if total <= 0:
+        return math.inf
+    idx = np.searchsorted(np.cumsum(pmf) / total, q)
+    return float(times[min(idx, len(times) - 1)])
+
+
+def print_analysis(sealed, aggression):
+    start = time.perf_counter()
+    chain = AirlockChain(sealed, aggression)
+    P, mean_ticks = chain.matrix()
+    bridge = chain.hitting(('bridge',))
+    race = chain.hitting(CARGO_NODES, avoid=('bridge',))
+    times, pmf = chain.hitting_time_distribution(('bridge',))
+    cargo_times, cargo_pmf = chain.hitting_time_distribution(CARGO_NODES, avoid=('bridge',))
+    elapsed = time.perf_counter() - start
+
+    print(f"Sealed: {', '.join(sorted(sealed)) or 'none'}   aggression: {aggression}")
+    print()
+    print("Transition matrix (rows: from, columns: to)")
+    print(" " * 13 + " ".join(f"{k[:6]:>6}" for k in chain.states))
+    for key, row, ticks in zip(chain.states, P, mean_ticks):
+        print(f"{key:>12} " + " ".join(f"{p:6.3f}" for p in row) + f"   {ticks / TICKS_PER_SECOND:5.1f}s/step")
+    print()
+    print(f"{'from':>12}  {'P(bridge)':>9}  {'E[t bridge]':>11}  {'P(cargo first)':>14}  {'E[t cargo]':>10}")
+    for key in chain.states:
+        pb, tb = bridge[key]
+        pc, tc = race[key]
+        print(f"{key:>12}  {pb:9.3f}  {tb / TICKS_PER_SECOND:10.1f}s  {pc:14.3f}  {tc / TICKS_PER_SECOND:9.1f}s")
+    print()
+    print(f"Time-to-bridge from reactor: P(within {times[-1]:.0f}s) {pmf.sum():.3f}  "
+          f"p10 {percentile(times, pmf, 0.1):.1f}s  median {percentile(times, pmf, 0.5):.1f}s  "
+          f"p90 {percentile(times, pmf, 0.9):.1f}s")
+    print(f"Time-to-cargo (before bridge) from reactor: P(within {cargo_times[-1]:.0f}s) {cargo_pmf.sum():.3f}  "
+          f"p10 {percentile(cargo_times, cargo_pmf, 0.1):.1f}s  median {percentile(cargo_times, cargo_pmf, 0.5):.1f}s  "
+          f"p90 {percentile(cargo_times, cargo_pmf, 0.9):.1f}s")
+    print(f"Analysis time: {elapsed * 1000:.1f} ms")
+
+
+def print_all_layouts(aggression, top):
+    """Rank every seal state by threat from the alien's starting room"""
+    start = time.perf_counter()
+    names = [f"B{i}" for i in range(1, 11)]
+    rows = []
+    for r in range(len(names) + 1):
+        for sealed in itertools.combinations(names, r):
+            race, seconds = threat_estimate(frozenset(sealed), 'reactor', aggression)
+            rows.append((race, -seconds, len(sealed), sealed))
+    elapsed = time.perf_counter() - start
+
+    rows.sort()
+    print(f"{'P(bridge first)':>15}  {'E[t bridge]':>11}  sealed")
+    for race, neg_seconds, _, sealed in rows[:top]:
+        print(f"{race:15.3f}  {-neg_seconds:10.1f}s  {' '.join(sealed) or 'none'}")
+    print(f"\n{len(rows)} layouts analysed in {elapsed:.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exact airlock difficulty estimator")
+    parser.add_argument("--seal", action="append", default=[],
+                        help="Bulkhead to treat as sealed (repeatable)")
+    parser.add_argument("--aggression", type=float, default=2.0)
+    parser.add_argument("--all-layouts", action="store_true",
+                        help="Rank every seal state instead of analysing one")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.all_layouts:
+        print_all_layouts(args.aggression, args.top)
+    else:
+        print_analysis([s.upper() for s in args.seal], args.aggression)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+"""
+Pygame-free simulation core for the ALIEN: MUTHUR airlock puzzle
+
+The ship graph, bulkheads, alien AI and MUTHER terminal commands, stepped one
+tick at a time with an injected clock and RNG. scenes/airlock.py renders it;
+headless tools (batch runner, Markov estimator, solver) drive it directly.
+"""
+
+import math
+import random
+
+TICKS_PER_SECOND = 60
+
+class PathNode:
+    def __init__(self, x, y, name):
+        self.x = x
+        self.y = y
+        self.name = name
+        self.connections = []
+    
+    def add_connection(self, node, bulkhead=None):
+        self.connections.append((node, bulkhead))
+        node.connections.append((self, bulkhead))
+
+class Bulkhead:
+    def __init__(self, name, x, y, orientation='v'):
+        self.name = name
+        self.x = x
+        self.y = y
+        self.orientation = orientation
+        self.sealed = False
+
+class Alien:
+    def __init__(self, start_node, bridge_node, clock, rng=random):
+        # Injected millisecond clock and RNG so the AI can run headless
+        self.clock = clock
+        self.rng = rng
+        self.x = float(start_node.x)
+        self.y = float(start_node.y)
+        self.current_node = start_node
+        self.bridge_node = bridge_node
+        self.path = []
+        self.move_speed = 2.0
+        self.state = 'idle'
+        self.idle_timer = 0
+        self.blocked_timer = 0
+        self.blocked_position = None
+        self.prowl_target = None
+        self.aggression_level = 0
+        self.last_room_visit = {}
+        self.fade_cycle = 0
+    
+    def get_sealed_bulkhead_position(self, node, bulkheads):
+        for connected_node, bulkhead_name in node.connections:
+            if bulkhead_name and bulkhead_name in bulkheads and bulkheads[bulkhead_name].sealed:
+                bh = bulkheads[bulkhead_name]
+                dx = bh.x - node.x
+                dy = bh.y - node.y
+                dist = math.hypot(dx, dy)
+                if dist > 0:
+                    offset = 30
+                    target_x = bh.x - (dx / dist) * offset
+                    target_y = bh.y - (dy / dist) * offset
+                    return (target_x, target_y)
+        return None
+    
+    def get_open_connections(self, node, bulkheads):
+        open_connections = []
+        for connected_node, bulkhead_name in node.connections:
+            if bulkhead_name is None:
+                open_connections.append(connected_node)
+            elif bulkhead_name not in bulkheads or not bulkheads[bulkhead_name].sealed:
+                open_connections.append(connected_node)
+        return open_connections
+    
+    def find_path_bfs(self, target_node, bulkheads):
+        if self.current_node == target_node:
+            return []
+        
+        visited = {self.current_node}
+        queue = [(self.current_node, [])]
+        
+        while queue:
+            node, path = queue.pop(0)
+            for next_node in self.get_open_connections(node, bulkheads):
+                if next_node == target_node:
+                    return path + [next_node]
+                if next_node not in visited:
+                    visited.add(next_node)
+                    queue.append((next_node, path + [next_node]))
+        
+        return None
+    
+    def choose_destination(self, all_nodes, bulkheads, hunting):
+        if hunting:
+            if self.rng.random() < 0.8:
+                return self.bridge_node
+            else:
+                nearby = [n for n in all_nodes 
+                         if n.name != 'waypoint' 
+                         and n != self.current_node
+                         and math.hypot(n.x - self.x, n.y - self.y) < 300]
+                return self.rng.choice(nearby) if nearby else self.bridge_node
+        else:
+            valid_targets = [n for n in all_nodes 
+                             if n.name != 'waypoint' 
+                             and n != self.current_node]
+            if valid_targets:
+                time_now = self.clock()
+                weights = []
+                for node in valid_targets:
+                    last_visit = self.last_room_visit.get(node.name, 0)
+                    time_since = time_now - last_visit
+                    weight = max(1, time_since / 1000)
+                    weights.append(weight)
+                
+                if self.rng.random() < 0.3:
+                    return self.rng.choice(valid_targets)
+                
+                total = sum(weights)
+                r = self.rng.uniform(0, total)
+                cumulative = 0
+                for node, weight in zip(valid_targets, weights):
+                    cumulative += weight
+                    if r <= cumulative:
+                        return node
+                return valid_targets[-1]
+            return None
+    
+    def update(self, all_nodes, bulkheads, player_pos):
+        self.aggression_level = min(2.0, self.aggression_level + 0.001)
+        self.fade_cycle = (self.fade_cycle + 1) % 1000
+        
+        dist_to_player = math.hypot(self.x - player_pos[0], self.y - player_pos[1])
+        hunting = dist_to_player < 350 + (self.aggression_level * 50)
+        
+        if self.state == 'blocked':
+            self.blocked_timer -= 1
+            
+            if self.prowl_target:
+                dx = self.prowl_target[0] - self.x
+                dy = self.prowl_target[1] - self.y
+                dist = math.hypot(dx, dy)
+                
+                if dist > 5:
+                    move_speed = 1.2 + self.aggression_level * 0.3
+                    self.x += (dx / dist) * move_speed
+                    self.y += (dy / dist) * move_speed
+                else:
+                    base_x = self.prowl_target[0]
+                    base_y = self.prowl_target[1]
+                    
+                    if abs(base_x - self.current_node.x) > abs(base_y - self.current_node.y):
+                        offset_y = math.sin(self.clock() / 200) * 18
+                        offset_y += math.sin(self.clock() / 150) * 6
+                        self.x = base_x
+                        self.y = base_y + offset_y
+                    else:
+                        offset_x = math.sin(self.clock() / 200) * 18
+                        offset_x += math.sin(self.clock() / 150) * 6
+                        self.x = base_x + offset_x
+                        self.y = base_y
+            elif self.blocked_position:
+                offset = math.sin(self.clock() / 300) * 12
+                offset += math.sin(self.clock() / 180) * 5
+                self.x = self.blocked_position[0] + offset
+                self.y = self.blocked_position[1]
+            
+            if self.blocked_timer <= 0:
+                self.state = 'idle'
+                self.blocked_position = None
+                self.prowl_target = None
+                self.idle_timer = 30 + int(30 / (self.aggression_level + 1))
+            return
+        
+        if self.state == 'idle':
+            self.idle_timer -= 1
+            if self.rng.random() < 0.1:
+                self.x += self.rng.uniform(-2, 2)
+                self.y += self.rng.uniform(-2, 2)
+            if self.idle_timer <= 0:
+                self.state = 'choosing'
+            return
+        
+        if self.state == 'choosing':
+            destination = self.choose_destination(all_nodes, bulkheads, hunting)
+            if destination:
+                new_path = self.find_path_bfs(destination, bulkheads)
+                if new_path:
+                    self.path = new_path
+                    self.state = 'moving'
+                    if destination.name != 'waypoint':
+                        self.last_room_visit[destination.name] = self.clock()
+                else:
+                    if hunting:
+                        wander_dest = self.choose_destination(all_nodes, bulkheads, False)
+                        if wander_dest:
+                            wander_path = self.find_path_bfs(wander_dest, bulkheads)
+                            if wander_path:
+                                self.path = wander_path
+                                self.state = 'moving'
+                                return
+                    self.state = 'blocked'
+                    self.blocked_timer = 150 - int(self.aggression_level * 30)
+                    self.blocked_position = (self.x, self.y)
+                    self.prowl_target = self.get_sealed_bulkhead_position(self.current_node, bulkheads)
+            else:
+                self.state = 'idle'
+                self.idle_timer = 60 - int(self.aggression_level * 20)
+            return
+        
+        if self.state == 'moving':
+            if not self.path:
+                self.state = 'idle'
+                self.idle_timer = self.rng.randint(20, 60) if not hunting else self.rng.randint(10, 25)
+                return
+            
+            next_node = self.path[0]
+            
+            if next_node not in self.get_open_connections(self.current_node, bulkheads):
+                self.path = []
+                self.state = 'blocked'
+                self.blocked_timer = 150 - int(self.aggression_level * 30)
+                self.blocked_position = (self.x, self.y)
+                self.prowl_target = self.get_sealed_bulkhead_position(self.current_node, bulkheads)
+                return
+            
+            dx = next_node.x - self.x
+            dy = next_node.y - self.y
+            distance = math.hypot(dx, dy)
+            
+            if distance < 2.0:
+                self.current_node = next_node
+                self.x = float(next_node.x)
+                self.y = float(next_node.y)
+                self.path.pop(0)
+                
+                if self.path:
+                    next_next = self.path[0]
+                    if next_next not in self.get_open_connections(self.current_node, bulkheads):
+                        self.path = []
+                        self.state = 'blocked'
+                        self.blocked_timer = 150 - int(self.aggression_level * 30)
+                        self.blocked_position = (self.x, self.y)
+                        self.prowl_target = self.get_sealed_bulkhead_position(self.current_node, bulkheads)
+                return
+            
+            base_speed = self.move_speed * (1.0 + self.aggression_level * 0.3)
+            if hunting:
+                speed_multiplier = 1.8 + math.sin(self.clock() / 400) * 0.3
+            else:
+                speed_multiplier = 0.8 + math.sin(self.clock() / 800) * 0.4
+                if self.rng.random() < 0.05:
+                    speed_multiplier = 1.5
+            
+            speed = min(base_speed * speed_multiplier, distance)
+            self.x += (dx / distance) * speed
+            self.y += (dy / distance) * speed
+
+
+# Player position on the schematic (the bridge)
+PLAYER_POS = (110, 90)
+
+# Bulkheads that isolate the cargo bay from the rest of the ship
+CARGO_BULKHEADS = ['B8', 'B9', 'B10']
+
+def build_ship():
+    """Build the alien navigation graph and bulkheads
+    
+    Returns:
+        (nodes, bulkheads, all_navigation_nodes)
+    """
+    nodes = {
+        'bridge': PathNode(110, 90, 'bridge'),
+        'galley': PathNode(300, 90, 'galley'),
+        'medbay': PathNode(490, 90, 'medbay'),
+        'hypersleep': PathNode(685, 90, 'hypersleep'),
+        'engineering': PathNode(160, 300, 'engineering'),
+        'crew': PathNode(380, 300, 'crew'),
+        'reactor': PathNode(580, 300, 'reactor'),
+        'cargo_left': PathNode(160, 515, 'cargo'),
+        'cargo_center': PathNode(380, 515, 'cargo'),
+        'cargo_right': PathNode(580, 515, 'cargo'),
+    }
+    
+    bulkheads = {
+        'B1': Bulkhead('B1', 195, 90, 'v'),
+        'B2': Bulkhead('B2', 365, 90, 'v'),
+        'B3': Bulkhead('B3', 585, 90, 'v'),
+        'B4': Bulkhead('B4', 110, 180, 'h'),
+        'B5': Bulkhead('B5', 300, 195, 'h'),
+        'B6': Bulkhead('B6', 490, 195, 'h'),
+        'B7': Bulkhead('B7', 685, 180, 'h'),
+        'B8': Bulkhead('B8', 160, 405, 'h'),
+        'B9': Bulkhead('B9', 380, 405, 'h'),
+        'B10': Bulkhead('B10', 580, 405, 'h'),
+    }
+    
+    waypoint_bridge_out = PathNode(180, 90, 'waypoint')
+    waypoint_galley_out_right = PathNode(360, 90, 'waypoint')
+    waypoint_galley_down = PathNode(300, 130, 'waypoint')
+    waypoint_galley_mid = PathNode(300, 195, 'waypoint')
+    waypoint_medbay_down = PathNode(490, 140, 'waypoint')
+    waypoint_medbay_mid = PathNode(490, 195, 'waypoint')
+    waypoint_medbay_out = PathNode(560, 90, 'waypoint')
+    waypoint_hypersleep_down = PathNode(685, 140, 'waypoint')
+    waypoint_hypersleep_mid = PathNode(685, 180, 'waypoint')
+    waypoint_bridge_down = PathNode(110, 140, 'waypoint')
+    waypoint_bridge_mid = PathNode(110, 180, 'waypoint')
+    
+    waypoint_eng_out = PathNode(240, 300, 'waypoint')
+    waypoint_crew_left_entry = PathNode(320, 300, 'waypoint')
+    waypoint_crew_right_exit = PathNode(440, 300, 'waypoint')
+    waypoint_crew_to_reactor = PathNode(480, 300, 'waypoint')
+    waypoint_reactor_entry = PathNode(520, 300, 'waypoint')
+    
+    waypoint_crew_to_b6_horizontal = PathNode(490, 300, 'waypoint')
+    waypoint_b6_bottom = PathNode(490, 240, 'waypoint')
+    waypoint_crew_up_to_b6 = PathNode(490, 195, 'waypoint')
+    
+    waypoint_bridge_to_eng = PathNode(110, 240, 'waypoint')
+    waypoint_hypersleep_to_reactor = PathNode(685, 300, 'waypoint')
+    
+    waypoint_eng_down = PathNode(160, 360, 'waypoint')
+    waypoint_crew_down = PathNode(380, 340, 'waypoint')
+    waypoint_reactor_down = PathNode(580, 350, 'waypoint')
+    
+    nodes['bridge'].add_connection(waypoint_bridge_out)
+    waypoint_bridge_out.add_connection(nodes['galley'], 'B1')
+    
+    nodes['galley'].add_connection(waypoint_galley_out_right)
+    waypoint_galley_out_right.add_connection(nodes['medbay'], 'B2')
+    
+    nodes['medbay'].add_connection(waypoint_medbay_out)
+    waypoint_medbay_out.add_connection(nodes['hypersleep'], 'B3')
+    
+    nodes['bridge'].add_connection(waypoint_bridge_down)
+    waypoint_bridge_down.add_connection(waypoint_bridge_mid)
+    waypoint_bridge_mid.add_connection(waypoint_bridge_to_eng, 'B4')
+    waypoint_bridge_to_eng.add_connection(nodes['engineering'])
+    
+    nodes['galley'].add_connection(waypoint_galley_down)
+    waypoint_galley_down.add_connection(waypoint_galley_mid)
+    waypoint_galley_mid.add_connection(waypoint_crew_left_entry, 'B5')
+    waypoint_crew_left_entry.add_connection(nodes['crew'])
+    
+    nodes['medbay'].add_connection(waypoint_medbay_down)
+    waypoint_medbay_down.add_connection(waypoint_medbay_mid)
+    waypoint_medbay_mid.add_connection(waypoint_crew_up_to_b6, 'B6')
+    waypoint_crew_up_to_b6.add_connection(waypoint_b6_bottom)
+    waypoint_b6_bottom.add_connection(waypoint_crew_to_b6_horizontal)
+    
+    nodes['hypersleep'].add_connection(waypoint_hypersleep_down)
+    waypoint_hypersleep_down.add_connection(waypoint_hypersleep_mid)
+    waypoint_hypersleep_mid.add_connection(waypoint_hypersleep_to_reactor, 'B7')
+    waypoint_hypersleep_to_reactor.add_connection(nodes['reactor'])
+    
+    nodes['crew'].add_connection(waypoint_crew_right_exit)
+    waypoint_crew_right_exit.add_connection(waypoint_crew_to_b6_horizontal)
+    
+    waypoint_crew_to_b6_horizontal.add_connection(waypoint_crew_to_reactor)
+    waypoint_crew_to_reactor.add_connection(waypoint_reactor_entry)
+    waypoint_reactor_entry.add_connection(nodes['reactor'])
+    
+    nodes['engineering'].add_connection(waypoint_eng_out)
+    waypoint_eng_out.add_connection(waypoint_crew_left_entry)
+    
+    nodes['engineering'].add_connection(waypoint_eng_down)
+    waypoint_eng_down.add_connection(nodes['cargo_left'], 'B8')
+    
+    nodes['crew'].add_connection(waypoint_crew_down)
+    waypoint_crew_down.add_connection(nodes['cargo_center'], 'B9')
+    
+    nodes['reactor'].add_connection(waypoint_reactor_down)
+    waypoint_reactor_down.add_connection(nodes['cargo_right'], 'B10')
+    
+    nodes['cargo_left'].add_connection(nodes['cargo_center'])
+    nodes['cargo_center'].add_connection(nodes['cargo_right'])
+    
+    all_navigation_nodes = list(nodes.values()) + [
+        waypoint_bridge_out, waypoint_galley_out_right,
+        waypoint_galley_down, waypoint_galley_mid,
+        waypoint_medbay_down, waypoint_medbay_mid,
+        waypoint_medbay_out, waypoint_eng_out,
+        waypoint_crew_left_entry, waypoint_crew_right_exit,
+        waypoint_crew_to_reactor, waypoint_crew_up_to_b6,
+        waypoint_b6_bottom, waypoint_crew_to_b6_horizontal,
+        waypoint_reactor_entry, waypoint_eng_down,
+        waypoint_crew_down, waypoint_reactor_down,
+        waypoint_bridge_down, waypoint_bridge_mid,
+        waypoint_bridge_to_eng, waypoint_hypersleep_down,
+        waypoint_hypersleep_mid, waypoint_hypersleep_to_reactor
+    ]
+    
+    return nodes, bulkheads, all_navigation_nodes
+
+
+class AirlockSim:
+    """Airlock puzzle state advanced by explicit ticks
+    
+    Args:
+        clock: Optional millisecond clock; defaults to a virtual clock driven
+               by tick() at TICKS_PER_SECOND
+        rng: Optional random.Random for the alien AI
+        ship: Optional unused result of build_ship(), e.g. built ahead of time
+    """
+    def __init__(self, clock=None, rng=None, ship=None):
+        self.ticks = 0
+        self.clock = clock or self.virtual_time
+        self.rng = rng or random.Random()
+        self.nodes, self.bulkheads, self.all_nodes = ship or build_ship()
+        self.alien = Alien(self.nodes['reactor'], self.nodes['bridge'], self.clock, self.rng)
+        self.player_pos = PLAYER_POS
+        
+        self.game_won = False
+        self.game_over = False
+        self.end_time = 0
+        self.command_history = []
+        self.error_message = ""
+        self.message_timer = 0
+    
+    def virtual_time(self):
+        return self.ticks * 1000 // TICKS_PER_SECOND
+    
+    @property
+    def cargo_sealed(self):
+        return all(self.bulkheads[b].sealed for b in CARGO_BULKHEADS)
+    
+    @property
+    def active(self):
+        """True while the puzzle still accepts commands"""
+        return not self.game_won and not self.game_over
+    
+    @property
+    def finished(self):
+        """True once the end-of-game delay has expired"""
+        return not self.active and self.clock() > self.end_time
+    
+    @property
+    def outcome(self):
+        return "victory" if self.game_won else "failure"
+    
+    def alien_in_cargo(self):
+        return self.alien.current_node.name == 'cargo'
+    
+    def set_error(self, message):
+        self.error_message = message
+        self.message_timer = self.clock() + 2000
+    
+    def command(self, text):
+        """Run a MUTHER terminal command, e.g. 'SEAL B1' or 'OPEN AIRLOCK'
+        
+        Returns:
+            The error message, or "" if the command succeeded
+        """
+        cmd = text.strip().upper()
+        self.command_history.append(f"> {cmd}")
+        error = ""
+        
+        if cmd.startswith('SEAL '):
+            bh = cmd[5:]
+            if bh in self.bulkheads:
+                self.bulkheads[bh].sealed = True
+                self.command_history.append(f"BULKHEAD {bh} SEALED")
+                if bh in CARGO_BULKHEADS and self.cargo_sealed:
+                    self.command_history.append("CARGO BAY ISOLATED")
+            else:
+                error = "DOES NOT COMPUTE"
+        elif cmd.startswith('OPEN '):
+            target = cmd[5:]
+            if target == 'AIRLOCK':
+                if not self.cargo_sealed:
+                    error = "CARGO BAY NOT SEALED"
+                elif not self.alien_in_cargo():
+                    error = "TARGET NOT IN CARGO BAY"
+                else:
+                    self.game_won = True
+                    self.end_time = self.clock() + 2000
+                    self.command_history.append("AIRLOCK OPENING...")
+                    self.command_history.append("DECOMPRESSION INITIATED")
+            elif target in self.bulkheads:
+                self.bulkheads[target].sealed = False
+                self.command_history.append(f"BULKHEAD {target} OPENED")
+            else:
+                error = "DOES NOT COMPUTE"
+        else:
+            error = "DOES NOT COMPUTE"
+        
+        if error:
+            self.set_error(error)
+        self.command_history = self.command_history[-8:]
+        return error
+    
+    def tick(self):
+        """Advance the simulation by one tick"""
+        if self.active:
+            self.alien.update(self.all_nodes, self.bulkheads, self.player_pos)
+            if self.alien.current_node.name == 'bridge':
+                self.game_over = True
+                self.end_time = self.clock() + 2000
+        
+        if self.message_timer and self.clock() > self.message_timer:
+            self.error_message = ""
+            self.message_timer = 0
+        
+        self.ticks += 1
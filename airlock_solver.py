@@ -0,0 +1,203 @@
+"""
+Optimal-play solver and autoplay bot for the ALIEN: MUTHUR airlock puzzle
+
+The puzzle is won by sealing B8, B9 and B10 while the alien is in a cargo
+node and then issuing OPEN AIRLOCK. The solver searches every bulkhead seal
+state for a command schedule of the form:
+
+    1. Seal a set of bulkheads up front (bridge guards first)
+    2. When the alien enters the cargo bay, seal the remaining cargo bulkheads
+    3. OPEN AIRLOCK (re-open the trap and wait again if the alien slipped out)
+
+A schedule is robust when the bridge is unreachable from the alien once the
+up-front seals are in, whatever path the alien takes. Among robust schedules
+it prefers the fewest commands after the trigger (the window in which the
+alien can escape), then the shortest expected time to win using the Markov
+estimator in airlock_markov.py.
+
+The same schedule drives AutoplayBot, which types terminal commands into the
+real airlock scene for unattended end-to-end and soak runs.
+
+Usage:
+    python airlock_solver.py
+    python airlock_solver.py --soak 10 --headless
+"""
+
+import argparse
+import itertools
+import math
+import os
+import time
+from functools import lru_cache
+import pygame
+from airlock_markov import AirlockChain, CARGO_NODES, TICKS_PER_SECOND
+from airlock_sim import PLAYER_POS, CARGO_BULKHEADS
+
+ALL_BULKHEADS = [f"B{i}" for i in range(1, 11)]
+COMMAND_SECONDS = 1.5  # Time a player needs to type one command
+
+
+class Schedule:
+    """A conditional command schedule for the airlock puzzle"""
+    def __init__(self, pre_seal, trap, expected_seconds):
+        self.pre_seal = pre_seal
+        self.trap = trap
+        self.expected_seconds = expected_seconds
+
+    def steps(self):
+        """Human-readable (trigger, command) list"""
+        steps = [("at start", f"SEAL {bh}") for bh in self.pre_seal]
+        steps.append(("wait", "until the alien is in the CARGO BAY"))
+        steps.extend(("then", f"SEAL {bh}") for bh in self.trap)
+        steps.append(("then", "OPEN AIRLOCK"))
+        steps.extend(("if it escaped", f"OPEN {bh}") for bh in self.trap)
+        return steps
+
+    def strategy(self, session):
+        """Command generator in the airlock_batch strategy format
+
+        session must provide alien_in_cargo(), as AirlockSim does.
+        """
+        for bh in self.pre_seal:
+            yield f"SEAL {bh}"
+        while True:
+            while not session.alien_in_cargo():
+                yield None
+            for bh in self.trap:
+                yield f"SEAL {bh}"
+            yield "OPEN AIRLOCK"
+            for bh in self.trap:
+                yield f"OPEN {bh}"
+
+
+def guard_order(sealed, chain):
+    """Order seals so bulkheads nearest the bridge go in first"""
+    def distance(name):
+        bh = chain.bulkheads[name]
+        return math.hypot(bh.x - PLAYER_POS[0], bh.y - PLAYER_POS[1])
+    return sorted(sealed, key=distance)
+
+
+def evaluate(sealed, aggression):
+    """Score a set of up-front seals
+
+    Returns:
+        Schedule, or None when the seals are not robust or cannot win
+    """
+    chain = AirlockChain(sealed, aggression)
+    start = chain.nodes['reactor']
+    if chain.find_path(start, chain.nodes['bridge']) is not None:
+        return None  # Bridge still reachable
+
+    race = chain.hitting(CARGO_NODES, avoid=('bridge',))
+    prob, ticks = race['reactor']
+    if prob < 0.999:
+        return None  # Alien can get stuck outside the cargo bay
+
+    trap = [bh for bh in CARGO_BULKHEADS if bh not in sealed]
+    if not trap:
+        return None
+    commands = len(sealed) + len(trap) + 1
+    seconds = ticks / TICKS_PER_SECOND + COMMAND_SECONDS * commands
+    return Schedule(guard_order(sealed, chain), trap, seconds)
+
+
+@lru_cache(maxsize=8)
+def solve(aggression=2.0):
+    """Search all seal states for the best robust schedule"""
+    best = None
+    best_key = None
+    for r in range(len(ALL_BULKHEADS) + 1):
+        for sealed in itertools.combinations(ALL_BULKHEADS, r):
+            schedule = evaluate(sealed, aggression)
+            if schedule is None:
+                continue
+            key = (len(schedule.trap), round(schedule.expected_seconds, 1), len(sealed))
+            if best_key is None or key < best_key:
+                best, best_key = schedule, key
+    return best
+
+
+class AutoplayBot:
+    """Types a schedule's commands into the airlock terminal
+
+    The airlock scene calls update() once per frame with the live alien and
+    posts the returned key events.
+    """
+    def __init__(self, schedule, frames_per_key=3):
+        self.frames_per_key = frames_per_key
+        self.policy = schedule.strategy(self)
+        self.alien = None
+        self.typing = ""
+        self.frames = 0
+
+    def alien_in_cargo(self):
+        return self.alien.current_node.name == 'cargo'
+
+    def update(self, alien):
+        """Return the key events to post this frame"""
+        self.alien = alien
+        self.frames += 1
+        if self.frames % self.frames_per_key:
+            return []
+
+        if not self.typing:
+            cmd = next(self.policy)
+            if not cmd:
+                return []
+            self.typing = cmd + "\r"
+
+        char, self.typing = self.typing[0], self.typing[1:]
+        if char == "\r":
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode="\r", mod=0)]
+        return [pygame.event.Event(pygame.KEYDOWN, key=ord(char.lower()), unicode=char, mod=0)]
+
+
+def run_soak(schedule, games):
+    """Play the real airlock scene end to end with the bot"""
+    from scenes.airlock import run_airlock_puzzle
+
+    pygame.init()
+    outcomes = []
+    total_frames = 0
+    start = time.perf_counter()
+    for game in range(games):
+        bot = AutoplayBot(schedule)
+        game_start = time.perf_counter()
+        outcome = run_airlock_puzzle("AUTOPLAY", autoplay=bot, fps=0)
+        elapsed = time.perf_counter() - game_start
+        outcomes.append(outcome)
+        total_frames += bot.frames
+        print(f"  Game {game + 1}: {outcome} in {bot.frames} frames ({bot.frames / elapsed:.0f} fps)")
+    elapsed = time.perf_counter() - start
+
+    print(f"Soak: {outcomes.count('victory')}/{games} victories, "
+          f"{total_frames / elapsed:.0f} frames/s overall")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Airlock puzzle solver and autoplay bot")
+    parser.add_argument("--aggression", type=float, default=2.0)
+    parser.add_argument("--soak", type=int, default=0, metavar="GAMES",
+                        help="Play GAMES airlock sessions with the autoplay bot")
+    parser.add_argument("--headless", action="store_true",
+                        help="Use SDL's dummy video driver (no window)")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    start = time.perf_counter()
+    schedule = solve(args.aggression)
+    print(f"Solved in {time.perf_counter() - start:.2f} s")
+    print(f"Expected time to win: {schedule.expected_seconds:.1f} s")
+    for trigger, command in schedule.steps():
+        print(f"  {trigger:>14}: {command}")
+
+    if args.soak:
+        print()
+        run_soak(schedule, args.soak)
+
+if __name__ == "__main__":
+    main()
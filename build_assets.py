@@ -0,0 +1,85 @@
+"""
+Asset bundle build step for ALIEN: MUTHUR
+
+Packs every file under assets/ into a single indexed bundle file that the
+game memory-maps at runtime (see config.AssetBundle), so frozen builds load
+fonts and images from memory instead of extracting them to a temp dir.
+
+Bundle layout:
+    8 bytes   magic, b"AMBNDL01"
+    4 bytes   index length, little-endian
+    N bytes   JSON index: {"assets/name": [offset, length], ...}
+    ...       file data, each entry 16-byte aligned
+
+Usage:
+    python build_assets.py            # writes assets.bundle
+    pyinstaller ... --add-data "assets.bundle:."
+"""
+
+import json
+import os
+import struct
+import sys
+from config import BUNDLE_MAGIC, BUNDLE_NAME
+
+ASSET_DIR = "assets"
+ALIGN = 16
+
+
+def align(size):
+    return -(-size // ALIGN) * ALIGN
+
+
+def collect_assets(root=ASSET_DIR):
+    """List asset paths relative to the project root, in a stable order"""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.startswith("."):
+                continue
+            paths.append(os.path.join(dirpath, filename).replace(os.sep, "/"))
+    return paths
+
+
+def build_bundle(output=BUNDLE_NAME, root=ASSET_DIR):
+    """Write the bundle and return its index"""
+    blobs = []
+    for path in collect_assets(root):
+        with open(path, "rb") as f:
+            blobs.append((path, f.read()))
+
+    # Offsets depend on the index size, so re-lay the data until it settles
+    index = {path: [0, len(data)] for path, data in blobs}
+    while True:
+        index_bytes = json.dumps(index).encode()
+        offset = align(len(BUNDLE_MAGIC) + 4 + len(index_bytes))
+        moved = False
+        for path, data in blobs:
+            if index[path][0] != offset:
+                index[path][0] = offset
+                moved = True
+            offset += align(len(data))
+        if not moved:
+            break
+
+    with open(output, "wb") as f:
+        f.write(BUNDLE_MAGIC)
+        f.write(struct.pack("<I", len(index_bytes)))
+        f.write(index_bytes)
+        for path, data in blobs:
+            f.write(b"\0" * (index[path][0] - f.tell()))
+            f.write(data)
+    return index
+
+
+def main():
+    output = sys.argv[1] if len(sys.argv) > 1 else BUNDLE_NAME
+    index = build_bundle(output)
+    total = sum(length for _, length in index.values())
+    print(f"Packed {len(index)} assets ({total / 1024:.0f} KB) into {output}")
+    for path, (offset, length) in index.items():
+        print(f"  {path}: {length} bytes at {offset}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Static screen compositor for ALIEN: MUTHUR
+
+Bakes a fixed text layout (the credits) into one display-format surface
+when a scene starts, so each frame is a single blit. Named text keeps its
+rect for hit-testing, e.g. the credits' LinkedIn link. A screen with nothing
+on top is presented directly, so its scaled copy is reused. Screens that
+draw static under their text (the stable title and game over) keep the text
+surfaces instead and blit them after the static.
+"""
+
+from config import WIDTH, HEIGHT, TERMINAL_BLACK
+import display
+
+class StaticScreen:
+    """A full-screen layout of text rendered once
+
+    Args:
+        size: Screen size
+        background: Fill color behind the text
+    """
+    def __init__(self, size=(WIDTH, HEIGHT), background=TERMINAL_BLACK):
+        self.surface = display.acquire(size)
+        self.surface.fill(background)
+        self.rects = {}
+
+    def text(self, text, font, color, name=None, **position):
+        """Render text onto the layout, positioned like get_rect(), e.g. center=(x, y)
+
+        Returns:
+            The text's rect, also kept in self.rects under name if given
+        """
+        text_surface = font.render(text, True, color)
+        rect = text_surface.get_rect(**position)
+        self.surface.blit(text_surface, rect)
+        display.forget(self.surface)
+        if name:
+            self.rects[name] = rect
+        return rect
+
+    def blit(self, surface, position, name=None):
+        """Composite a pre-rendered surface onto the layout"""
+        rect = self.surface.blit(surface, position)
+        display.forget(self.surface)
+        if name:
+            self.rects[name] = rect
+        return rect
+
+    def draw(self, target):
+        target.blit(self.surface, (0, 0))
+
+    def present(self):
+        """Show the layout as the whole frame, scaled once for the window size"""
+        display.present(self.surface, static=True)
+
+    def release(self):
+        """Return the layout's surface to the pool once the scene is done"""
+        display.forget(self.surface)
+        display.release(self.surface)
+        self.surface = None
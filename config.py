@@ -25,10 +25,56 @@ POWER_COLOR = TERMINAL_GREEN
 DATA_COLOR = TERMINAL_GREEN
 COOLANT_COLOR = TERMINAL_GREEN
 
+# Output scaling: the game lays out against WIDTH x HEIGHT and is scaled to
+# the window. 'scaled' lets SDL scale on the GPU (SCALED mode, HiDPI aware,
+# mouse positions mapped for us), falling back to 'window' where no renderer
+# is available; 'window' letterboxes in software into a resizable window.
+DISPLAY_SCALING = 'scaled'
+WINDOW_SIZE = (WIDTH, HEIGHT)   # Starting size of a 'window' mode window
+FULLSCREEN = False
+FULLSCREEN_KEY = pygame.K_F11
 
+# Frame rates: full rate while animating, idle rate for static screens (pacing.py)
+FPS = 60
+IDLE_FPS = 10
+
+# Screen effects quality tiers, lowest first (see effects.QualityGovernor)
+#   density   - scale for static particle counts and shutdown columns
+#   frequency - scale for the per-frame chance of CRT flicker, static and scanlines
+#   scanlines - draw the cinematic scanline overlay
+#   postprocess - run the CRT post-process, if CRT_POSTPROCESS is on
+EFFECTS_TIERS = {
+    'low': {'density': 0.25, 'frequency': 0.5, 'scanlines': False, 'postprocess': False},
+    'medium': {'density': 0.6, 'frequency': 0.8, 'scanlines': True, 'postprocess': False},
+    'high': {'density': 1.0, 'frequency': 1.0, 'scanlines': True, 'postprocess': True},
+}
+EFFECTS_TIER = 'high'       # Starting tier; the governor adapts from here
+EFFECTS_FIXED_TIER = None   # Tier name to pin (no adaptation), e.g. for benchmarks
+
+# Curved-glass CRT post-process on every presented frame (crt.py, needs NumPy)
+CRT_POSTPROCESS = False
+CRT_BUDGET_MS = 4           # Per-frame cost checked by crt_benchmark.py
+
+# Startup budget in milliseconds, checked by startup_check.py
+STARTUP_BUDGET_MS = {
+    'imports': 500,      # main.py imports up to the title scene
+    'fonts': 100,        # title font loading
+    'first_frame': 1000, # launch to first presented frame
+}
+
+
+import io
+import json
+import mmap
 import os
+import struct
 import sys
 
+# Packed asset bundle (built by build_assets.py)
+BUNDLE_NAME = "assets.bundle"
+BUNDLE_MAGIC = b"AMBNDL01"
+FONT_PATH = "assets/VT323-Regular.ttf"
+
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
@@ -39,19 +85,91 @@ def get_resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
+class AssetBundle:
+    """Memory-mapped, indexed asset bundle"""
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mmap[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            raise ValueError(f"{path} is not an asset bundle")
+        start = len(BUNDLE_MAGIC)
+        (index_length,) = struct.unpack_from("<I", self.mmap, start)
+        self.index = json.loads(self.mmap[start + 4:start + 4 + index_length])
+        self.cache = {}
+    
+    def get(self, relative_path):
+        """Return an asset's bytes, or None if it is not bundled"""
+        if relative_path not in self.cache:
+            entry = self.index.get(relative_path)
+            if entry is None:
+                return None
+            offset, length = entry
+            # One copy out of the map; BytesIO readers share it from then on
+            self.cache[relative_path] = self.mmap[offset:offset + length]
+        return self.cache[relative_path]
+
+_bundle = None
+_bundle_checked = False
+
+def get_bundle():
+    """Open the asset bundle once, or return None when running unbundled"""
+    global _bundle, _bundle_checked
+    if not _bundle_checked:
+        _bundle_checked = True
+        path = get_resource_path(BUNDLE_NAME)
+        if os.path.exists(path):
+            try:
+                _bundle = AssetBundle(path)
+            except (OSError, ValueError) as e:
+                print(f"Asset bundle unusable ({e}). Loading assets from disk.")
+    return _bundle
+
+def open_asset(relative_path):
+    """Open an asset from the bundle if present, otherwise from disk
+    
+    Returns:
+        A file-like object (in-memory for bundled assets) or a file path
+    """
+    bundle = get_bundle()
+    data = bundle.get(relative_path) if bundle else None
+    if data is not None:
+        return io.BytesIO(data)
+    return get_resource_path(relative_path)
+
+# Loaded fonts, shared by every scene: size -> Font, 'game' -> load_fonts() tuple
+_font_cache = {}
+
+def load_font(size):
+    """Load the VT323 font at a single size, e.g. for title text"""
+    if size not in _font_cache:
+        try:
+            _font_cache[size] = pygame.font.Font(open_asset(FONT_PATH), size)
+        except:
+            _font_cache[size] = pygame.font.Font(None, size)
+    return _font_cache[size]
+
+def load_image(relative_path):
+    """Load an image asset from the bundle or disk"""
+    source = open_asset(relative_path)
+    if isinstance(source, str):
+        return pygame.image.load(source)
+    return pygame.image.load(source, os.path.basename(relative_path))
+
 def load_fonts():
-    """Load and return game fonts"""
+    """Load and return game fonts (loaded once, then shared)"""
+    if 'game' in _font_cache:
+        return _font_cache['game']
     try:
-        font_path = get_resource_path("assets/VT323-Regular.ttf")
-        font_large = pygame.font.Font(font_path, 50)
-        font_medium = pygame.font.Font(font_path, 28)
-        font_small = pygame.font.Font(font_path, 24)
+        font_large = pygame.font.Font(open_asset(FONT_PATH), 50)
+        font_medium = pygame.font.Font(open_asset(FONT_PATH), 28)
+        font_small = pygame.font.Font(open_asset(FONT_PATH), 24)
     except:
         print("VT323 font not found. Using default font.")
         font_large = pygame.font.Font(None, 36)
         font_medium = pygame.font.Font(None, 28)
         font_small = pygame.font.Font(None, 24)
     
+    _font_cache['game'] = (font_large, font_medium, font_small)
     return font_large, font_medium, font_small
 
 
@@ -0,0 +1,157 @@
+"""
+NumPy CRT post-process for ALIEN: MUTHUR
+
+An optional stage run on each finished frame just before it is presented.
+It reads the scene's frame and writes into a separate output surface, so a
+scene can keep drawing on (or snapshotting) its own target:
+
+    - barrel curvature: one gather of the packed pixels through a remap
+      table computed once per size, with the corners blacked out
+    - phosphor bloom: the green channel downsampled by BLOOM_SCALE, box
+      blurred and added back, saturating
+    - afterglow: the downsampled glow decays into a persistence buffer
+      instead of vanishing, leaving short trails behind moving light
+
+Everything works on views of the surfaces' pixel buffers with preallocated
+arrays, so a frame is one gather, a blit and part of the bloom update,
+which is spread over BLOOM_EVERY frames; no full-frame copies. crt_benchmark.py checks the cost against CRT_BUDGET_MS.
+Enabled by CRT_POSTPROCESS in config.py; needs NumPy.
+"""
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Barrel strength; mid-edges stay on the screen edge, corners curve away
+CURVATURE = 0.06
+# Downsampling factor for bloom and afterglow, and their strengths
+BLOOM_SCALE = 5
+BLOOM_STRENGTH = 0.6
+AFTERGLOW_DECAY = 0.75   # Per frame
+# Frames per bloom and afterglow update (at least 2: the update is split over
+# two frames); the halo is reused in between
+BLOOM_EVERY = 2
+
+def available():
+    return np is not None
+
+def barrel_lut(width, height, row_pixels, curvature=CURVATURE):
+    """Flat source index for every destination pixel, and a mask of those left black
+
+    Args:
+        width, height: Surface size
+        row_pixels: Pixels per buffer row (pitch // 4)
+    """
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    u = (x + 0.5) / (width / 2) - 1
+    v = (y + 0.5) / (height / 2) - 1
+    scale = (1 + curvature * (u * u + v * v)) / (1 + curvature)
+    src_x = np.floor((u * scale + 1) * (width / 2)).astype(np.int64)
+    src_y = np.floor((v * scale + 1) * (height / 2)).astype(np.int64)
+    outside = (src_x < 0) | (src_x >= width) | (src_y < 0) | (src_y >= height)
+    lut = np.clip(src_y, 0, height - 1) * row_pixels + np.clip(src_x, 0, width - 1)
+    return lut.astype(np.intp), outside
+
+class CRTPostProcess:
+    """Curvature, bloom and afterglow for display surfaces of one size and format
+
+    Args:
+        source: A frame of the size and format to be processed
+        target: A surface of the same size and format to write results into
+    """
+    def __init__(self, source, target):
+        width, height = self.size = source.get_size()
+        self.lut, outside = barrel_lut(width, height, source.get_pitch() // 4)
+        self.target_row_pixels = target.get_pitch() // 4
+        rows, cols = np.nonzero(outside)
+        self.outside = rows * self.target_row_pixels + cols
+        self.green_shift = target.get_shifts()[1]
+        self.frame_count = 0
+
+        # Afterglow and bloom work at 1/BLOOM_SCALE resolution on the part
+        # of the frame divisible by the scale, updated every BLOOM_EVERY frames
+        s = BLOOM_SCALE
+        self.small_h, self.small_w = height // s, width // s
+        self.glow = np.zeros((self.small_h, self.small_w), np.float32)
+        # Blur passes leave a one-texel unlit border
+        self.blur_rows = np.zeros((self.small_h, self.small_w), np.float32)
+        self.blur = np.zeros((self.small_h, self.small_w), np.float32)
+        self.small_halo = np.zeros((self.small_h, self.small_w), np.uint32)
+        self.halo_rows = np.zeros((self.small_h, self.small_w * s), np.uint32)
+        # Full-size halo, kept between updates and added with a saturating blit
+        self.halo = target.copy()
+        self.halo.fill((0, 0, 0))
+        self.halo_row_pixels = self.halo.get_pitch() // 4
+
+    def apply(self, source, target):
+        """Write the post-processed source into target; source is not changed"""
+        width, height = self.size
+
+        # Barrel curvature: gather the frame through the remap table
+        pixels = np.frombuffer(source.get_buffer(), np.uint32)
+        out = np.frombuffer(target.get_buffer(), np.uint32)
+        frame = out.reshape(height, self.target_row_pixels)[:, :width]
+        # The table is always in range, so mode='wrap' only skips the bounds check
+        # (and the buffered output that comes with it)
+        np.take(pixels, self.lut, out=frame, mode='wrap')
+        out[self.outside] = 0
+        del pixels
+        # The bloom update is spread over two frames: glow, then upsampling
+        phase = self.frame_count % BLOOM_EVERY
+        if phase == 0:
+            self.update_glow(frame)
+        elif phase == 1:
+            self.upsample_halo()
+        self.frame_count += 1
+        del out, frame
+
+        # Frame plus halo, saturating
+        target.blit(self.halo, (0, 0), special_flags=pygame.BLEND_ADD)
+
+    def update_glow(self, frame):
+        """Fold the curved frame into the afterglow and blur it into the low-res halo"""
+        s = BLOOM_SCALE
+        small_h, small_w = self.small_h, self.small_w
+
+        # Afterglow: sampled green level, decaying into the persistence buffer
+        sample = frame[s // 2:small_h * s:s, s // 2:small_w * s:s]
+        green = (sample >> self.green_shift) & 0xFF
+        np.multiply(self.glow, AFTERGLOW_DECAY ** BLOOM_EVERY, out=self.glow)
+        np.maximum(self.glow, green, out=self.glow)
+
+        # Bloom: 3x3 box blur of the glow at low resolution, rows then columns
+        glow, rows, blur = self.glow, self.blur_rows, self.blur
+        np.add(glow[:, :-2], glow[:, 1:-1], out=rows[:, 1:-1])
+        rows[:, 1:-1] += glow[:, 2:]
+        np.add(rows[:-2], rows[1:-1], out=blur[1:-1])
+        blur[1:-1] += rows[2:]
+        blur *= BLOOM_STRENGTH / 9
+        self.small_halo = blur.astype(np.uint32) << self.green_shift
+
+    def upsample_halo(self):
+        """Upsample the low-res halo into the halo surface, a row then a column at a time"""
+        s = BLOOM_SCALE
+        small_h, small_w = self.small_h, self.small_w
+        self.halo_rows.reshape(small_h, small_w, s)[:] = self.small_halo[:, :, None]
+        pixels = np.frombuffer(self.halo.get_buffer(), np.uint32).reshape(-1, self.halo_row_pixels)
+        pixels[:small_h * s, :small_w * s].reshape(small_h, s, small_w * s)[:] = self.halo_rows[:, None, :]
+        del pixels
+
+_processors = {}
+
+def apply(source, target):
+    """Write the post-processed source into target, building the tables on first use
+
+    Returns:
+        False (leaving target alone) when the post-process can't run
+    """
+    if np is None or source.get_bytesize() != 4 or target.get_size() != source.get_size():
+        return False
+    key = (source.get_size(), source.get_pitch(), target.get_pitch(), target.get_shifts())
+    if key not in _processors:
+        _processors[key] = CRTPostProcess(source, target)
+    _processors[key].apply(source, target)
+    return True
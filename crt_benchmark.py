@@ -0,0 +1,64 @@
+"""
+CRT post-process budget check for ALIEN: MUTHUR
+
+Renders a representative terminal frame headless and times crt.apply() on it
+over a run of frames. Fails (exit code 1) if the mean or 95th percentile
+frame is over config.CRT_BUDGET_MS, or if NumPy is missing.
+
+Usage:
+    python crt_benchmark.py --frames 300
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config import WIDTH, HEIGHT, TERMINAL_GREEN, TERMINAL_BLACK, CRT_BUDGET_MS, load_fonts
+import display
+import crt
+
+def draw_frame(screen, font, frame):
+    """A screen of terminal text, scrolling so the afterglow has work to do"""
+    screen.fill(TERMINAL_BLACK)
+    for row in range(HEIGHT // 40):
+        text = f"MU/TH/UR 6000 > INTERFACE 2037 READY {frame + row:06d}"
+        screen.blit(font.render(text, True, TERMINAL_GREEN), (40, 20 + row * 40 - frame % 40))
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the CRT post-process against budget")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    if not crt.available():
+        print("CRT post-process: NumPy not installed")
+        sys.exit(1)
+
+    screen = display.begin_scene("CRT benchmark", (WIDTH, HEIGHT))
+    output = display.acquire((WIDTH, HEIGHT))
+    font = load_fonts()[1]
+    # First frame builds the remap table; don't count it
+    draw_frame(screen, font, 0)
+    crt.apply(screen, output)
+
+    times = []
+    for frame in range(args.frames):
+        draw_frame(screen, font, frame)
+        start = time.perf_counter()
+        crt.apply(screen, output)
+        times.append((time.perf_counter() - start) * 1000)
+
+    times.sort()
+    mean = sum(times) / len(times)
+    p95 = times[int(len(times) * 0.95)]
+    print(f"CRT post-process: mean {mean:.2f} ms, p95 {p95:.2f} ms, budget {CRT_BUDGET_MS} ms")
+    ok = mean <= CRT_BUDGET_MS and p95 <= CRT_BUDGET_MS
+    print("CRT budget:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
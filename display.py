@@ -0,0 +1,258 @@
+"""
+Persistent display manager for ALIEN: MUTHUR
+
+The window is created once and never torn down. Scenes ask for a logical
+render target of the size they lay out against; a target that matches a
+fixed-size window is the window itself, anything else is an offscreen
+surface that present() scales and letterboxes into the window.
+
+With DISPLAY_SCALING = 'scaled' SDL owns the scaling: the window surface
+stays at the logical size whatever the real window or fullscreen size, so
+scenes draw straight into it. In software ('window') mode the window can be
+resized freely, every scene gets an offscreen target, and static frames
+(StaticScreen.present) keep their scaled copy between frames instead of
+being rescaled each time.
+"""
+
+import time
+import warnings
+import pygame
+from config import WIDTH, HEIGHT, TERMINAL_BLACK, DISPLAY_SCALING, WINDOW_SIZE, FULLSCREEN
+
+class SurfacePool:
+    """Display-format surfaces keyed by (size, flags), recycled between uses
+    
+    Frame loops acquire() their scratch surfaces up front and release() them
+    afterwards, so nothing is allocated per frame and every blit from a pooled
+    surface is a same-format blit.
+    """
+    def __init__(self):
+        self.free = {}
+        self.keys = {}
+
+    def acquire(self, size, flags=0):
+        """Return a free surface of this size and flags, creating one if needed"""
+        key = (tuple(size), flags)
+        free = self.free.get(key)
+        if free:
+            surface = free.pop()
+        else:
+            surface = pygame.Surface(key[0], flags)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if flags & pygame.SRCALPHA else surface.convert()
+        self.keys[id(surface)] = key
+        return surface
+
+    def release(self, surface):
+        """Give a surface back to the pool"""
+        key = self.keys.pop(id(surface), None)
+        if key is not None:
+            surface.set_alpha(None)
+            self.free.setdefault(key, []).append(surface)
+
+class DisplayManager:
+    """Owns the game window and the scenes' logical render targets"""
+    def __init__(self):
+        self.window = None
+        self.caption = None
+        self.targets = {}
+        self.converted = {}
+        self.static = {}
+        self.scratches = {}
+        self.pool = SurfacePool()
+        self.frame_listeners = []
+        self.postprocess = None
+        self.fullscreen = FULLSCREEN
+        # True while the window surface itself is a fixed logical size
+        self.logical = True
+
+    def get_window(self):
+        """Create the window on first use, or adopt one a test script made"""
+        if self.window is None:
+            if not pygame.get_init():
+                pygame.init()
+            self.window = pygame.display.get_surface()
+            if self.window is None:
+                self.open_window()
+        return self.window
+
+    def open_window(self):
+        """(Re)create the window for the configured scaling and fullscreen state"""
+        flags = pygame.FULLSCREEN if self.fullscreen else 0
+        if DISPLAY_SCALING == 'scaled':
+            # Without a renderer (e.g. the dummy driver) SDL either refuses or
+            # warns and gives a plain window
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    self.window = pygame.display.set_mode((WIDTH, HEIGHT), flags | pygame.SCALED | pygame.RESIZABLE)
+                self.logical = bool(self.window.get_flags() & pygame.SCALED)
+                if self.logical:
+                    return
+            except pygame.error:
+                pass
+        # Software scaling; (0, 0) is the desktop size
+        size = (0, 0) if self.fullscreen else WINDOW_SIZE
+        self.window = pygame.display.set_mode(size, flags | pygame.RESIZABLE)
+        self.logical = False
+
+    def toggle_fullscreen(self):
+        window = self.get_window()
+        self.fullscreen = not self.fullscreen
+        if self.logical and window.get_flags() & pygame.SCALED:
+            pygame.display.toggle_fullscreen()
+        else:
+            self.open_window()
+
+    def set_caption(self, caption):
+        if caption and caption != self.caption:
+            pygame.display.set_caption(caption)
+            self.caption = caption
+
+    def begin_scene(self, caption=None, size=(WIDTH, HEIGHT)):
+        """Return the render target for a scene with the given logical size"""
+        window = self.get_window()
+        self.set_caption(caption)
+        # With a post-process stage the window holds its output, never the scene
+        if self.logical and self.postprocess is None and tuple(size) == window.get_size():
+            return window
+        if size not in self.targets:
+            self.targets[size] = self.pool.acquire(size)
+        return self.targets[size]
+
+    def convert(self, key, surface, alpha=False):
+        """Convert a surface to the display format once and cache it by key"""
+        if key not in self.converted:
+            self.get_window()
+            self.converted[key] = surface.convert_alpha() if alpha else surface.convert()
+        return self.converted[key]
+
+    def letterbox_rect(self, size):
+        """Largest rect with the target's aspect ratio centred in the window"""
+        window_w, window_h = self.window.get_size()
+        scale = min(window_w / size[0], window_h / size[1])
+        w, h = int(size[0] * scale), int(size[1] * scale)
+        return pygame.Rect((window_w - w) // 2, (window_h - h) // 2, w, h)
+
+    def to_logical(self, position, size=(WIDTH, HEIGHT)):
+        """Map a window position (e.g. event.pos) into a target of the given size"""
+        if self.logical:
+            return position
+        rect = self.letterbox_rect(size)
+        return ((position[0] - rect.x) * size[0] // rect.w,
+                (position[1] - rect.y) * size[1] // rect.h)
+
+    def present(self, surface=None, static=False):
+        """Show a frame: flip the window, scaling an offscreen target into it first
+
+        Args:
+            surface: The scene's render target (None for the window)
+            static: surface doesn't change between frames, so its scaled copy
+                    can be kept at output resolution and reused
+        """
+        window = self.get_window()
+        if self.postprocess is not None:
+            surface, static = self.post_process(window if surface is None else surface, static)
+        if surface is not None and surface is not window:
+            rect = self.letterbox_rect(surface.get_size())
+            if rect.size == surface.get_size():
+                scaled = surface
+            elif static:
+                scaled = self.static_layer(surface, rect.size)
+            else:
+                scaled = self.scratch("scaled", rect.size)
+                pygame.transform.scale(surface, rect.size, scaled)
+            if rect.size != window.get_size():
+                window.fill(TERMINAL_BLACK)
+            window.blit(scaled, rect)
+        pygame.display.flip()
+        now = time.perf_counter()
+        for listener in self.frame_listeners:
+            listener(now)
+
+    def scratch(self, name, size):
+        """A pooled surface kept under name, replaced when the size changes"""
+        surface = self.scratches.get(name)
+        if surface is None or surface.get_size() != size:
+            if surface is not None:
+                self.pool.release(surface)
+            surface = self.scratches[name] = self.pool.acquire(size)
+        return surface
+
+    def post_process(self, surface, static):
+        """Run the post-process stage from surface into a separate output
+
+        The scene's own surface is never modified. Returns the surface to
+        present and whether it is still static.
+        """
+        size = surface.get_size()
+        if surface is self.window:
+            # A window drawn on directly; the stage needs its own source
+            source = self.scratch("source", size)
+            source.blit(surface, (0, 0))
+            surface = source
+        if self.logical and size == self.window.get_size():
+            target = self.window
+        else:
+            target = self.scratch("processed", size)
+        if self.postprocess(surface, target):
+            return target, False
+        return surface, static
+
+    def static_layer(self, surface, size):
+        """A static surface scaled to size, kept until the size changes or it's forgotten"""
+        cached = self.static.get(id(surface))
+        if cached is None or cached.get_size() != size:
+            if cached is not None:
+                self.pool.release(cached)
+            cached = self.static[id(surface)] = self.pool.acquire(size)
+            pygame.transform.scale(surface, size, cached)
+        return cached
+
+    def forget(self, surface):
+        """Drop a static surface's scaled copy after it changes or is released"""
+        cached = self.static.pop(id(surface), None)
+        if cached is not None:
+            self.pool.release(cached)
+
+_manager = DisplayManager()
+
+def get_window():
+    return _manager.get_window()
+
+def begin_scene(caption=None, size=(WIDTH, HEIGHT)):
+    return _manager.begin_scene(caption, size)
+
+def convert(key, surface, alpha=False):
+    return _manager.convert(key, surface, alpha)
+
+def present(surface=None, static=False):
+    _manager.present(surface, static)
+
+def to_logical(position, size=(WIDTH, HEIGHT)):
+    return _manager.to_logical(position, size)
+
+def toggle_fullscreen():
+    _manager.toggle_fullscreen()
+
+def forget(surface):
+    _manager.forget(surface)
+
+def add_frame_listener(listener):
+    """Call listener(perf_counter_time) after every presented frame"""
+    _manager.frame_listeners.append(listener)
+
+def set_postprocess(stage):
+    """Run stage(frame, output) on every finished frame before it is scaled and shown
+
+    The stage writes into output and returns True, or returns False to have
+    the frame shown as it is.
+    """
+    _manager.postprocess = stage
+
+def acquire(size, flags=0):
+    _manager.get_window()
+    return _manager.pool.acquire(size, flags)
+
+def release(surface):
+    _manager.pool.release(surface)
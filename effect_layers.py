@@ -0,0 +1,125 @@
+"""
+Background producer for ALIEN: MUTHUR's static noise layers
+
+Heavy static (hundreds of random dots a frame in the title, game over and
+shutdown sequences) depends only on the RNG, so a worker thread renders the
+next few frames of it ahead of time as 8-bit NumPy index arrays, where the
+index is the dot's green level. The main loop wraps a ready array as a
+palettised, colour-keyed surface without copying and blits it once.
+
+Dot counts are rounded down to COUNT_BUCKETS so a few queues cover every
+intensity without a lower tier ever drawing more dots than it asked for.
+Requests below MIN_COUNT are cheaper to draw directly, and take() returns
+None on a miss (or without NumPy), so callers always draw the dots
+themselves as a fallback and never wait on the worker.
+"""
+
+import queue
+import threading
+import pygame
+from config import WIDTH, HEIGHT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Frames rendered ahead per kind of layer
+QUEUE_SIZE = 4
+# Dot counts layers are rendered at; smaller requests are drawn directly
+COUNT_BUCKETS = (100, 150, 200, 250, 300, 400)
+MIN_COUNT = COUNT_BUCKETS[0]
+
+# Palette index i is green level i; index 0 is transparent
+PALETTE = [(0, level, 0) for level in range(256)]
+
+def disk_offsets(radius):
+    """Pixel offsets covered by a dot of the given radius"""
+    if radius <= 1:
+        return [(0, 0)]
+    span = range(-radius + 1, radius)
+    return [(dx, dy) for dx in span for dy in span if dx * dx + dy * dy < radius * radius]
+
+def bucket(count):
+    """Round a dot count down to a rendered bucket (count >= MIN_COUNT)"""
+    return max(size for size in COUNT_BUCKETS if size <= count)
+
+class NoiseLayerProducer:
+    """Renders static noise layers ahead of time on a worker thread
+
+    Args:
+        queue_size: Layers kept ready per (count, brightness, size) kind
+        seed: Optional seed for the worker's RNG
+    """
+    def __init__(self, queue_size=QUEUE_SIZE, seed=None):
+        self.queue_size = queue_size
+        self.rng = np.random.default_rng(seed)
+        self.queues = {}
+        self.lock = threading.Lock()
+        self.wanted = threading.Event()
+        self.thread = None
+        self.disks = {radius: np.array(disk_offsets(radius)) for radius in range(1, 4)}
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            self.wanted.wait()
+            self.wanted.clear()
+            with self.lock:
+                kinds = list(self.queues.items())
+            for kind, layers in kinds:
+                while not layers.full():
+                    layers.put(self.render(*kind))
+
+    def render(self, count, brightness, max_size):
+        """One layer of count dots as a (HEIGHT, WIDTH) uint8 index array"""
+        rng = self.rng
+        layer = np.zeros((HEIGHT, WIDTH), np.uint8)
+        xs = rng.integers(0, WIDTH + 1, count)
+        ys = rng.integers(0, HEIGHT + 1, count)
+        levels = rng.integers(brightness[0], brightness[1] + 1, count, dtype=np.uint8)
+        sizes = rng.integers(1, max_size + 1, count)
+        for radius in range(1, max_size + 1):
+            chosen = sizes == radius
+            for dx, dy in self.disks[radius]:
+                x = xs[chosen] + dx
+                y = ys[chosen] + dy
+                inside = (x >= 0) & (x < WIDTH) & (y >= 0) & (y < HEIGHT)
+                layer[y[inside], x[inside]] = levels[chosen][inside]
+        return layer
+
+    def take(self, count, brightness=(50, 255), max_size=3):
+        """A ready layer as a surface, or None if none is ready yet"""
+        kind = (bucket(count), brightness, max_size)
+        layers = self.queues.get(kind)
+        if layers is None:
+            with self.lock:
+                layers = self.queues.setdefault(kind, queue.Queue(self.queue_size))
+            self.start()
+        try:
+            layer = layers.get_nowait()
+        except queue.Empty:
+            layer = None
+        self.wanted.set()
+        if layer is None:
+            return None
+        # Wraps the array without copying; the surface keeps it alive
+        surface = pygame.image.frombuffer(layer, (WIDTH, HEIGHT), 'P')
+        surface.set_palette(PALETTE)
+        surface.set_colorkey(0)
+        return surface
+
+_producer = None
+
+def take(count, brightness=(50, 255), max_size=3):
+    """A pre-rendered layer of about count dots, or None to draw them directly"""
+    global _producer
+    if np is None or count < MIN_COUNT:
+        return None
+    if _producer is None:
+        _producer = NoiseLayerProducer()
+    return _producer.take(count, brightness, max_size)
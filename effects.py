@@ -0,0 +1,260 @@
+"""
+Shared screen effects for ALIEN: MUTHUR
+
+Static, scanlines, flicker and glitch text for the title, game over and
+shutdown sequences and engine.apply_crt_effects. Overlays are built once in
+the display format and reused; the random-alpha scanlines are pre-rendered
+into one tall strip and each frame blits a different window of it.
+
+The effect workload follows the quality tiers in config.EFFECTS_TIERS. The
+QualityGovernor watches frame times as frames are presented and steps the
+tier down when frames run long, and back up after a stretch on target. The
+optional CRT post-process (crt.py) runs only on tiers that allow it.
+"""
+
+import random
+from contextlib import contextmanager
+import pygame
+from config import (WIDTH, HEIGHT, FPS, EFFECTS_TIERS, EFFECTS_TIER, EFFECTS_FIXED_TIER,
+                    CRT_POSTPROCESS)
+import display
+import effect_layers
+import crt
+
+# Scanline spacing and alpha range used by the cinematic sequences
+SCANLINE_SPACING = 3
+SCANLINE_ALPHA = (5, 20)
+# Number of distinct scanline patterns rotated through, one per frame
+SCANLINE_VARIANTS = 16
+
+# Fixed scanlines drawn by apply_crt_effects
+CRT_SCANLINE_SPACING = 4
+CRT_SCANLINE_ALPHA = 10
+
+TIER_ORDER = list(EFFECTS_TIERS)
+
+tier = None
+density = 1.0
+frequency = 1.0
+scanlines = True
+postprocess = True
+_scanline_strip = None
+_scanline_frame = 0
+_crt_scanlines = None
+_overlays = {}
+
+def apply_tier(name):
+    """Switch the effect settings to a tier from config.EFFECTS_TIERS"""
+    global tier, density, frequency, scanlines, postprocess
+    settings = EFFECTS_TIERS[name]
+    tier = name
+    density = settings['density']
+    frequency = settings['frequency']
+    scanlines = settings['scanlines']
+    postprocess = settings['postprocess']
+
+def scaled(count):
+    """Scale a particle count by the current tier's density"""
+    return int(count * density)
+
+def chance(probability):
+    """Roll for an occasional effect, scaled by the current tier's frequency"""
+    return random.random() < probability * frequency
+
+class QualityGovernor:
+    """Adapts the effects tier to the measured frame time
+
+    Frame intervals are taken between presented frames. When more than
+    SLOW_SHARE of a window of frames run over SLOW_FRAME times the target
+    interval the tier steps down; after UP_AFTER frames in a row on target it
+    steps back up, waiting twice as long next time if that step had to be
+    undone straight away.
+
+    Args:
+        start: Starting tier name
+        fixed: Tier name to pin instead, disabling adaptation (benchmarks)
+    """
+    WINDOW = 30
+    STRICT_WINDOW = 10
+    SLOW_FRAME = 1.25
+    SLOW_SHARE = 0.25
+    UP_AFTER = 180
+    MAX_UP_AFTER = 3600
+
+    def __init__(self, start=EFFECTS_TIER, fixed=EFFECTS_FIXED_TIER, fps=FPS):
+        self.fixed = fixed is not None
+        self.index = TIER_ORDER.index(fixed or start)
+        self.target = 1.0 / fps
+        self.last = None
+        self.window = []
+        self.good_frames = 0
+        self.up_after = self.UP_AFTER
+        self.frames_since_up = None
+        self.strict = 0
+        apply_tier(TIER_ORDER[self.index])
+
+    def pin(self, name):
+        """Fix the tier, e.g. for benchmarking"""
+        self.fixed = True
+        self.index = TIER_ORDER.index(name)
+        apply_tier(name)
+
+    def skip(self):
+        """Don't count the next interval (idle frames, pauses)"""
+        self.last = None
+
+    def step(self, direction):
+        self.index = max(0, min(len(TIER_ORDER) - 1, self.index + direction))
+        apply_tier(TIER_ORDER[self.index])
+        self.window = []
+        self.good_frames = 0
+
+    def frame(self, now):
+        """Record a presented frame at time now (seconds)"""
+        last, self.last = self.last, now
+        if self.fixed or last is None:
+            return
+        slow = now - last > self.target * self.SLOW_FRAME
+        self.window.append(slow)
+        self.good_frames = 0 if slow else self.good_frames + 1
+        if self.frames_since_up is not None:
+            self.frames_since_up += 1
+
+        window = self.STRICT_WINDOW if self.strict else self.WINDOW
+        if len(self.window) >= window:
+            if sum(self.window) > self.SLOW_SHARE * len(self.window) and self.index > 0:
+                # A step up that fails within a window is retried later
+                if self.frames_since_up is not None and self.frames_since_up <= window:
+                    self.up_after = min(self.MAX_UP_AFTER, self.up_after * 2)
+                self.frames_since_up = None
+                self.step(-1)
+            self.window = []
+
+        if (not self.strict and self.good_frames >= self.up_after
+                and self.index < len(TIER_ORDER) - 1):
+            self.frames_since_up = 0
+            self.step(1)
+
+governor = QualityGovernor()
+display.add_frame_listener(governor.frame)
+
+def crt_postprocess(frame, output):
+    """Present-time CRT stage, skipped on tiers without it"""
+    return postprocess and crt.apply(frame, output)
+
+if CRT_POSTPROCESS and crt.available():
+    display.set_postprocess(crt_postprocess)
+
+@contextmanager
+def holding_pace():
+    """Hold target fps for a block: react to slow frames faster, never step up"""
+    governor.strict += 1
+    try:
+        yield
+    finally:
+        governor.strict -= 1
+
+def heavy_static_effect(surface, intensity=200):
+    """Create heavy static interference"""
+    count = scaled(intensity)
+    # Heavy static comes pre-rendered from the worker thread when one is ready
+    layer = effect_layers.take(count)
+    if layer is not None:
+        surface.blit(layer, (0, 0))
+        return
+    for _ in range(count):
+        x = random.randint(0, WIDTH)
+        y = random.randint(0, HEIGHT)
+        brightness = random.randint(50, 255)
+        color = (0, brightness, 0)
+        size = random.randint(1, 3)
+        pygame.draw.circle(surface, color, (x, y), size)
+
+def build_scanline_strip():
+    """Random-alpha scanlines, SCANLINE_VARIANTS lines taller than the screen"""
+    height = HEIGHT + SCANLINE_VARIANTS * SCANLINE_SPACING
+    strip = pygame.Surface((WIDTH, height), pygame.SRCALPHA)
+    for y in range(0, height, SCANLINE_SPACING):
+        alpha = random.randint(*SCANLINE_ALPHA)
+        pygame.draw.line(strip, (0, 0, 0, alpha), (0, y), (WIDTH, y), 1)
+    return display.convert("scanline_strip", strip, alpha=True)
+
+def scanline_effect(surface):
+    """Draw horizontal scanlines across screen, a different pattern each frame"""
+    global _scanline_strip, _scanline_frame
+    if not scanlines:
+        return
+    if _scanline_strip is None:
+        _scanline_strip = build_scanline_strip()
+    _scanline_frame = (_scanline_frame + 1) % SCANLINE_VARIANTS
+    offset = _scanline_frame * SCANLINE_SPACING
+    surface.blit(_scanline_strip, (0, 0), (0, offset, WIDTH, HEIGHT))
+
+def crt_scanline_effect(surface):
+    """Draw the fixed light scanlines used by apply_crt_effects"""
+    global _crt_scanlines
+    if _crt_scanlines is None:
+        lines = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        for y in range(0, HEIGHT, CRT_SCANLINE_SPACING):
+            pygame.draw.line(lines, (0, 0, 0, CRT_SCANLINE_ALPHA), (0, y), (WIDTH, y), 1)
+        _crt_scanlines = display.convert("crt_scanlines", lines, alpha=True)
+    surface.blit(_crt_scanlines, (0, 0))
+
+def overlay(color, alpha):
+    """Full-screen solid overlay in the display format, reused per color"""
+    if color not in _overlays:
+        # Held for the whole game, one per color
+        solid = display.acquire((WIDTH, HEIGHT))
+        solid.fill(color)
+        _overlays[color] = solid
+    surface = _overlays[color]
+    surface.set_alpha(alpha)
+    return surface
+
+def flicker_effect(surface, intensity, color=(0, 0, 0)):
+    """Apply screen flicker"""
+    if intensity > 0:
+        surface.blit(overlay(color, intensity), (0, 0))
+
+class GlitchText:
+    """Text rasterised once, with a pre-baked palette of ghost tints
+    
+    draw() composites randomly tinted ghost copies at fixed offsets under the
+    main text, so the glitch costs a few blits per frame and no rendering.
+    """
+    # Ghost copy offsets, chance of each showing per frame, and tint range
+    OFFSETS = [(-2, -2), (2, 2), (-3, 1)]
+    GHOST_CHANCE = 0.7
+    GHOST_GREEN = (100, 200)
+    TINTS = 6
+    
+    def __init__(self, text, font, base_color):
+        self.text = text
+        self.surface = font.render(text, True, base_color).convert_alpha()
+        low, high = self.GHOST_GREEN
+        step = (high - low) / (self.TINTS - 1)
+        self.ghosts = [font.render(text, True, (0, int(low + i * step), 0)).convert_alpha()
+                       for i in range(self.TINTS)]
+    
+    def get_rect(self, **kwargs):
+        return self.surface.get_rect(**kwargs)
+    
+    def draw(self, surface, x, y):
+        """Draw with glitch ghosts"""
+        for offset_x, offset_y in self.OFFSETS:
+            if random.random() < self.GHOST_CHANCE:
+                surface.blit(random.choice(self.ghosts), (x + offset_x, y + offset_y))
+        surface.blit(self.surface, (x, y))
+
+_glitch_texts = {}
+
+def glitch_text(text, font, base_color):
+    """Shared GlitchText for a text, font and color"""
+    key = (text, font, base_color)
+    if key not in _glitch_texts:
+        _glitch_texts[key] = GlitchText(text, font, base_color)
+    return _glitch_texts[key]
+
+def draw_glitch_text(surface, text, x, y, font, base_color):
+    """Draw text with glitch offset effect"""
+    glitch_text(text, font, base_color).draw(surface, x, y)
@@ -6,13 +6,21 @@ import pygame
 import random
 import time
 import sys
-from config import WIDTH, HEIGHT, TERMINAL_GREEN, TERMINAL_BLACK
+from config import WIDTH, HEIGHT, TERMINAL_GREEN, TERMINAL_BLACK, load_fonts
+import display
+import effects
+import layout
+import pacing
+import warmup
 
 # CRT Effects globals
 flicker_intensity = 0
 static_active = False
 static_timer = 0
 
+# Seconds a full page of dialogue stays up before the next page starts
+PAGE_HOLD = 1.5
+
 def display_typing_sequence(texts, screen, start_y=50, line_spacing=35, line_pauses=None):
     """Display a sequence of typing texts
     
@@ -24,56 +32,73 @@ def display_typing_sequence(texts, screen, start_y=50, line_spacing=35, line_pau
         line_pauses: Optional dict of {line_index: pause_time} for pauses after specific lines
                      Example: {0: 1.0, 2: 0.5} pauses 1 sec after line 0, 0.5 sec after line 2
     """
+    return type_pages(layout.layout_lines(texts, start_y, line_spacing), screen, line_pauses)
+
+def type_dialogue(block, screen, player_name=None, start_y=100, line_spacing=40, line_pauses=None, font=None):
+    """Type out a dialogue block, filling in {player_name}; layout is cached per block and name"""
+    if font is None:
+        font = load_fonts()[0]
+    pages = layout.block_pages(block, font, player_name, start_y, line_spacing)
+    return type_pages(pages, screen, line_pauses)
+
+@effects.holding_pace()  # The horror pacing must not drop below target fps
+def type_pages(pages, screen, line_pauses=None):
+    """Type out laid-out pages (see layout.py) one after another
+
+    Line pauses are keyed by source line and apply after its last wrapped piece.
+    Returns the last page's text objects.
+    """
     clock = pygame.time.Clock()
-    text_objects = []
-    current_text_index = 0
-    y_position = start_y
-    pause_until = None
     
     # Default: no pauses between lines
     if line_pauses is None:
         line_pauses = {}
     
-    for text_info in texts:
-        text, font = text_info
-        text_obj = TypingText(text, 50, y_position, font, TERMINAL_GREEN)
-        text_objects.append(text_obj)
-        y_position += line_spacing
-    
-    # Animate all texts
-    all_finished = False
-    while not all_finished:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-        
-        current_time = time.time()
-        
-        # Check if we're in a pause
-        if pause_until and current_time < pause_until:
-            pass  # Wait during pause
-        else:
-            pause_until = None
-            # Update current text
-            if current_text_index < len(text_objects):
-                if text_objects[current_text_index].update(current_time):
-                    # Line finished typing, check if it needs a pause
-                    if current_text_index in line_pauses:
-                        pause_until = current_time + line_pauses[current_text_index]
-                    current_text_index += 1
-        
-        # Check if all finished
-        all_finished = all(text.finished for text in text_objects) and pause_until is None
-        
-        # Draw
-        screen.fill(TERMINAL_BLACK)
-        for text_obj in text_objects:
-            text_obj.draw(screen)
-        apply_crt_effects(screen)
-        
-        pygame.display.flip()
-        clock.tick(60)
+    for page_number, page in enumerate(pages):
+        text_objects = [TypingText(line.text, line.x, line.y, line.font, TERMINAL_GREEN) for line in page]
+        last_page = page_number == len(pages) - 1
+        current_text_index = 0
+        pause_until = None
+
+        # Animate the page
+        all_finished = False
+        while not all_finished:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+            
+            current_time = time.time()
+            
+            # Check if we're in a pause
+            if pause_until and current_time < pause_until:
+                pass  # Wait during pause
+            else:
+                pause_until = None
+                # Update current text
+                if current_text_index < len(text_objects):
+                    if text_objects[current_text_index].update(current_time):
+                        # Line finished typing, check if it needs a pause
+                        line = page[current_text_index]
+                        if line.last and line.source in line_pauses:
+                            pause_until = current_time + line_pauses[line.source]
+                        current_text_index += 1
+                        # Hold a full page before moving on to the next
+                        if current_text_index == len(text_objects) and not last_page:
+                            pause_until = max(pause_until or 0, current_time + PAGE_HOLD)
+            
+            # Check if all finished
+            all_finished = all(text.finished for text in text_objects) and pause_until is None
+            
+            # Draw
+            screen.fill(TERMINAL_BLACK)
+            for text_obj in text_objects:
+                text_obj.draw(screen)
+            apply_crt_effects(screen)
+            
+            display.present(screen)
+            warmup.step()
+            clock.tick(pacing.frame_cap)
     
     return text_objects
 
@@ -83,24 +108,21 @@ def apply_crt_effects(surface):
     global flicker_intensity, static_active, static_timer
     
     # Random flicker effect
-    if random.random() < 0.05:
+    if effects.chance(0.05):
         flicker_intensity = random.randint(5, 25)
     
     if flicker_intensity > 0:
-        flicker_overlay = pygame.Surface((WIDTH, HEIGHT))
-        flicker_overlay.fill((0, 0, 0))
-        flicker_overlay.set_alpha(flicker_intensity)
-        surface.blit(flicker_overlay, (0, 0))
+        effects.flicker_effect(surface, flicker_intensity)
         flicker_intensity = max(0, flicker_intensity - 2)
     
     # Random static effect
     static_timer -= 1
-    if static_timer <= 0 and random.random() < 0.02:
+    if static_timer <= 0 and effects.chance(0.02):
         static_active = True
         static_timer = random.randint(2, 6)
     
     if static_active:
-        for _ in range(50):
+        for _ in range(effects.scaled(50)):
             x = random.randint(0, WIDTH)
             y = random.randint(0, HEIGHT)
             intensity = random.randint(100, 255)
@@ -112,19 +134,13 @@ def apply_crt_effects(surface):
             static_active = False
     
     # Scanline effect
-    if random.random() < 0.3:
-        scanline_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for y in range(0, HEIGHT, 4):
-            pygame.draw.line(scanline_surface, (0, 0, 0, 10), (0, y), (WIDTH, y), 1)
-        surface.blit(scanline_surface, (0, 0))
+    if effects.chance(0.3):
+        effects.crt_scanline_effect(surface)
 
 def green_flash(screen, duration=0.1):
     """Flash the screen green"""
-    flash_surface = pygame.Surface((WIDTH, HEIGHT))
-    flash_surface.fill(TERMINAL_GREEN)
-    flash_surface.set_alpha(200)
-    screen.blit(flash_surface, (0, 0))
-    pygame.display.flip()
+    screen.blit(effects.overlay(TERMINAL_GREEN, 200), (0, 0))
+    display.present(screen)
     time.sleep(duration)
 
 def wait_for_time(duration, screen, texts_to_draw):
@@ -142,8 +158,42 @@ def wait_for_time(duration, screen, texts_to_draw):
         for text_obj in texts_to_draw:
             text_obj.draw(screen)
         apply_crt_effects(screen)
-        pygame.display.flip()
-        clock.tick(60)
+        display.present(screen)
+        warmup.step()
+        clock.tick(pacing.frame_cap)
+
+# Full-line text surfaces keyed by (font, text, color); typing reveals them by clipping
+_line_cache = {}
+
+def render_line(font, text, color):
+    """Render a line of text once and reuse the surface"""
+    key = (font, text, color)
+    if key not in _line_cache:
+        _line_cache[key] = font.render(text, True, color)
+    return _line_cache[key]
+
+def splice_line(font, parts, name, color):
+    """Cache the line parts joined by name, composed from cached runs
+
+    The fixed parts are rendered once as templates; only the name is new, so
+    a named line costs one small render and a few blits.
+    """
+    text = name.join(parts)
+    key = (font, text, color)
+    if key not in _line_cache:
+        runs = [render_line(font, parts[0], color)]
+        for part in parts[1:]:
+            runs.append(render_line(font, name, color))
+            runs.append(render_line(font, part, color))
+        surface = pygame.Surface((sum(run.get_width() for run in runs),
+                                  max(run.get_height() for run in runs)), pygame.SRCALPHA)
+        x = 0
+        for run in runs:
+            # Runs don't overlap; MAX onto transparent black copies them exactly
+            surface.blit(run, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += run.get_width()
+        _line_cache[key] = surface
+    return _line_cache[key]
 
 class TypingText:
     """Handles typing animation for text"""
@@ -168,6 +218,7 @@ class TypingText:
     
     def draw(self, surface):
         if self.current_char > 0:
-            displayed_text = self.text[:self.current_char]
-            text_surface = self.font.render(displayed_text, True, self.color)
-            surface.blit(text_surface, (self.x, self.y))
\ No newline at end of file
+            # Blit the typed prefix out of the pre-rendered full line
+            line_surface = render_line(self.font, self.text, self.color)
+            width = layout.measure(self.font, self.text[:self.current_char])[0]
+            surface.blit(line_surface, (self.x, self.y), (0, 0, width, line_surface.get_height()))
\ No newline at end of file
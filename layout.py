@@ -0,0 +1,95 @@
+"""
+Text layout for ALIEN: MUTHUR dialogue
+
+Wraps dialogue lines to the screen width and splits blocks that run past the
+bottom of the screen into pages, using the font's own metrics. Measurements
+are memoised per (font, text) and a block's pages per (block, player_name),
+so a block is laid out once however many frames it is drawn for.
+"""
+
+from collections import namedtuple
+from config import WIDTH, HEIGHT
+
+# Left edge of dialogue text, also kept clear on the right and at the bottom
+MARGIN = 50
+
+# A laid-out line: source is the index of the dialogue line it came from, and
+# last marks the final wrapped piece of that line
+Line = namedtuple("Line", "text font x y source last")
+
+_sizes = {}
+_pages = {}
+
+def measure(font, text):
+    """(width, height) of text in font, measured once"""
+    key = (font, text)
+    size = _sizes.get(key)
+    if size is None:
+        size = _sizes[key] = font.size(text)
+    return size
+
+def wrap(font, text, max_width):
+    """Split text into lines no wider than max_width, breaking at spaces
+
+    A single word wider than max_width is broken between characters.
+    """
+    if measure(font, text)[0] <= max_width:
+        return [text]
+    lines = []
+    line = ""
+    for word in text.split(" "):
+        candidate = f"{line} {word}" if line else word
+        if measure(font, candidate)[0] <= max_width:
+            line = candidate
+            continue
+        if line:
+            lines.append(line)
+        # Break an over-long word
+        while measure(font, word)[0] > max_width and len(word) > 1:
+            cut = len(word) - 1
+            while cut > 1 and measure(font, word[:cut])[0] > max_width:
+                cut -= 1
+            lines.append(word[:cut])
+            word = word[cut:]
+        line = word
+    lines.append(line)
+    return lines
+
+def layout_lines(texts, top, line_spacing, width=WIDTH, height=HEIGHT, margin=MARGIN):
+    """Wrap (text, font) pairs and paginate them
+
+    Args:
+        texts: List of (text, font) tuples, one per dialogue line
+        top: y of the first line on each page
+        line_spacing: Distance between line tops
+    Returns:
+        List of pages, each a list of Line; always at least one page
+
+    Blank lines never start a page, and trailing blank lines are dropped from
+    the last page, so no page is left showing nothing.
+    """
+    pages = [[]]
+    y = top
+    for source, (text, font) in enumerate(texts):
+        pieces = wrap(font, text, width - 2 * margin)
+        for i, piece in enumerate(pieces):
+            if y + measure(font, piece)[1] > height - margin and pages[-1] and piece.strip():
+                pages.append([])
+                y = top
+            pages[-1].append(Line(piece, font, margin, y, source, i == len(pieces) - 1))
+            y += line_spacing
+    while pages[-1] and not pages[-1][-1].text.strip():
+        pages[-1].pop()
+    return pages
+
+def block_pages(block, font, player_name=None, top=100, line_spacing=40):
+    """Pages for a dialogue block with {player_name} filled in, laid out once"""
+    if isinstance(block, str):
+        block = [block]
+    key = (tuple(block), player_name, font, top, line_spacing)
+    pages = _pages.get(key)
+    if pages is None:
+        texts = [(line.format(player_name=player_name) if player_name is not None else line, font)
+                 for line in block]
+        pages = _pages[key] = layout_lines(texts, top, line_spacing)
+    return pages
@@ -0,0 +1,58 @@
+"""
+Dialogue layout check for ALIEN: MUTHUR
+
+Lays out every dialogue block in scenes/dialogue.py the way the story types
+it, for a short and a long player name and every line spacing the script
+uses. Fails (exit code 1) if any block produces a page with nothing but blank
+lines on it, which the story would hold on as an empty screen.
+
+Usage:
+    python layout_check.py
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from config import load_fonts
+from layout import block_pages
+from scenes import dialogue
+from scenes.narrative import TOP_POSITION, LINE_SPACING
+from scenes.story import CHAPTERS
+
+PLAYER_NAMES = ["Ripley", "Ellen Louise Ripley-Lambert of the Nostromo"]
+
+def main():
+    pygame.init()
+    font = load_fonts()[0]
+    spacings = {LINE_SPACING} | {screen["spacing"] for chapter in CHAPTERS.values()
+                                 for screen in chapter if "spacing" in screen}
+
+    status = 0
+    checked = 0
+    for table_name in dir(dialogue):
+        table = getattr(dialogue, table_name)
+        if not table_name.isupper() or not isinstance(table, dict):
+            continue
+        for key, block in table.items():
+            for player_name in PLAYER_NAMES:
+                for spacing in sorted(spacings):
+                    pages = block_pages(block, font, player_name, TOP_POSITION, spacing)
+                    checked += 1
+                    for number, page in enumerate(pages):
+                        if not any(line.text.strip() for line in page):
+                            status = 1
+                            print(f"{table_name}.{key}: page {number + 1} of {len(pages)} is blank "
+                                  f"(name {player_name!r}, spacing {spacing})")
+
+    print(f"Checked {checked} layouts")
+    print("Dialogue layout:", "PASS" if status == 0 else "FAIL")
+    pygame.quit()
+    sys.exit(status)
+
+if __name__ == "__main__":
+    main()
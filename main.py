@@ -1,73 +1,224 @@
 """
 ALIEN: MUTHUR - Main launcher
+
+Runs the whole game, or starts at any scene with a prepared player name:
+
+    python main.py --scene airlock --player-name Ripley
+    python main.py --scene maze --headless --fps-cap 0 --frames 600 --profile
+
+A story scene can start at one of its screens (numbered from 0 in
+scenes/story.py), e.g. --scene opening:5 for the warning.
 """
 
+import startup  # First, so the startup profile covers every other import
+import argparse
+import os
+import random
 import pygame
-from config import WIDTH, HEIGHT
+from config import EFFECTS_TIERS
+import display
+import effects
+import pacing
+import warmup
 from scenes.title import run_title_sequence
-from scenes.narrative import (run_opening, run_maze_completion, run_navigation_dialogue,
-                              run_airlock_intro, run_airlock_ending, run_victory_narrative)
-from scenes.maze import run_maze_game
-from scenes.airlock import run_airlock_puzzle
-from scenes.credits import run_credits_screen
-
-def run_airlock_section(screen, player_name):
-    """Run airlock puzzle and endings - can be replayed"""
+
+startup.mark("imports")
+
+# Scenes needed after the title, imported in the background while it plays
+LATER_SCENES = ["scenes.narrative", "scenes.maze", "scenes.airlock", "scenes.credits"]
+
+# Scenes --scene can start at, in game order
+SCENES = ["title", "opening", "maze", "maze_completion", "navigation", "airlock", "victory", "credits"]
+# Scenes that are chapters of scenes/story.py, so can start at a screen
+STORY_SCENES = ["opening", "maze_completion", "navigation", "victory"]
+# Player name for runs that start after the name prompt
+DEFAULT_PLAYER_NAME = "Ripley"
+
+class FrameLimitReached(Exception):
+    """Raised after the last frame of a --frames run"""
+
+class FrameReport:
+    """Frame timings for a run, taken as frames are presented
+
+    Args:
+        limit: Stop the run after this many frames, or None to run on
+    """
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.count = 0
+        self.last = None
+        self.intervals = []
+
+    def frame(self, now):
+        self.count += 1
+        if self.last is not None:
+            self.intervals.append((now - self.last) * 1000)
+        self.last = now
+        if self.limit and self.count >= self.limit:
+            raise FrameLimitReached()
+
+    def report(self):
+        if not self.intervals:
+            return f"Frames: {self.count}"
+        intervals = sorted(self.intervals)
+        mean = sum(intervals) / len(intervals)
+        p95 = intervals[int(len(intervals) * 0.95)]
+        return (f"Frames: {self.count}, mean {mean:.2f} ms ({1000 / mean:.0f} fps), "
+                f"p95 {p95:.2f} ms, max {intervals[-1]:.2f} ms, effects tier {effects.tier}")
+
+def warm_scene_imports():
+    """Import the later scenes so they are ready when the title ends"""
+    import importlib
+    for module_name in LATER_SCENES:
+        importlib.import_module(module_name)
+    startup.mark("scenes_imported")
+
+def run_airlock_section(screen, player_name, first="airlock", rng=None, at_screen=0):
+    """Run airlock puzzle and endings - can be replayed
+
+    first may be "victory" (from screen at_screen) or "credits" to start part
+    way through; rng, if given, drives the alien so a seeded run repeats.
+    """
+    from scenes.narrative import run_airlock_intro, run_airlock_ending, run_victory_narrative
+    from scenes.airlock import run_airlock_puzzle
+    from scenes.credits import run_credits_screen
+    
     while True:
-        # Airlock puzzle introduction
-        run_airlock_intro(screen)
-        
-        # Launch puzzle 2: airlock puzzle
-        outcome = run_airlock_puzzle(player_name)
-        
-        # Display airlock ending based on outcome
-        run_airlock_ending(screen, player_name, outcome)
+        if first == "airlock":
+            # Airlock puzzle introduction
+            run_airlock_intro(screen)
+            
+            # Launch puzzle 2: airlock puzzle
+            outcome = run_airlock_puzzle(player_name, rng=rng)
+            
+            # Display airlock ending based on outcome
+            run_airlock_ending(screen, player_name, outcome)
+        else:
+            outcome = "victory" if first == "victory" else None
         
         # If player wins airlock, show "victory" dialogue
         if outcome == "victory":
-            run_victory_narrative(screen, player_name)
+            run_victory_narrative(screen, player_name, at_screen)
+            at_screen = 0
         
         # Show credits screen (regardless of outcome)
         result = run_credits_screen()
         
         if result == "replay":
+            first = "airlock"
             continue  # Replay airlock section
         else:
             break  # Exit to close game
 
-def run_game():
-    """Run full game sequence"""
-    # Initialize Pygame
-    pygame.init()
+def run_game(scene="title", player_name=None, rng=None, at_screen=0):
+    """Run full game sequence, or the rest of it from a scene in SCENES
+
+    at_screen starts a scene in STORY_SCENES part way through.
+    """
+    start = SCENES.index(scene)
+    
+    # Initialize Pygame and create the window (once, for the whole game)
+    with startup.measure("pygame_init"):
+        pygame.init()
+        screen = display.begin_scene("Alien: Muthur")
     
-    # Create screen
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Alien: Muthur")
+    # Build the later scenes' assets and imports while the title sequence runs
+    warmup.schedule_game_assets(scene_imports=warm_scene_imports)
     
     # Run title sequence
-    run_title_sequence(screen)
+    if start <= SCENES.index("title"):
+        run_title_sequence(screen)
+    
+    from scenes.narrative import run_opening, run_maze_to_airlock
+    from scenes.maze import run_maze_game
     
     # Run opening sequence: player name, scene setting
-    player_name = run_opening(screen)
+    if start <= SCENES.index("opening"):
+        # Starting part way through skips the name prompt
+        given_name = (player_name or DEFAULT_PLAYER_NAME) if scene == "opening" and at_screen else None
+        player_name = run_opening(screen, given_name, at_screen)
+    player_name = player_name or DEFAULT_PLAYER_NAME
 
     # Launch puzzle 1: maze game
-    run_maze_game(player_name)
-    
-    # Maze completion narrative
-    run_maze_completion(screen, player_name)
+    if start <= SCENES.index("maze"):
+        run_maze_game(player_name)
     
-    # Run navigation dialogue
-    run_navigation_dialogue(screen, player_name)
+    # Maze completion and navigation dialogue
+    if start <= SCENES.index("navigation"):
+        first = scene if scene in ("maze_completion", "navigation") else "maze_completion"
+        run_maze_to_airlock(screen, player_name, first, at_screen if scene == first else 0)
 
     # Run airlock section (which can be replayed)
-    run_airlock_section(screen, player_name)
+    run_airlock_section(screen, player_name, scene if scene in ("victory", "credits") else "airlock", rng,
+                        at_screen if scene == "victory" else 0)
+
+def scene_arg(value):
+    """Parse --scene as NAME or STORY_SCENE:SCREEN into (name, screen index)"""
+    from scenes.story import CHAPTERS
+    name, _, number = value.partition(":")
+    if name not in SCENES:
+        raise argparse.ArgumentTypeError(f"unknown scene {name!r} (choose from {', '.join(SCENES)})")
+    if not number:
+        return name, 0
+    if name not in STORY_SCENES:
+        raise argparse.ArgumentTypeError(f"only {', '.join(STORY_SCENES)} can start at a screen")
+    if not number.isdigit() or int(number) >= len(CHAPTERS[name]):
+        raise argparse.ArgumentTypeError(f"{name} has screens 0-{len(CHAPTERS[name]) - 1}")
+    return name, int(number)
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="ALIEN: MUTHUR")
+    parser.add_argument("--scene", type=scene_arg, default="title", metavar="SCENE[:SCREEN]",
+                        help=f"scene to start at, one of {', '.join(SCENES)}; later scenes follow as usual. "
+                             f"{', '.join(STORY_SCENES)} can start at a screen, e.g. opening:5")
+    parser.add_argument("--player-name", help=f"name for scenes after the prompt (default {DEFAULT_PLAYER_NAME})")
+    parser.add_argument("--seed", type=int, help="seed the random module for a repeatable run")
+    parser.add_argument("--headless", action="store_true", help="no window or sound (SDL dummy drivers)")
+    parser.add_argument("--fps-cap", type=int, help="frame cap for scene loops, 0 for uncapped")
+    parser.add_argument("--tier", choices=list(EFFECTS_TIERS), help="pin the effects quality tier")
+    parser.add_argument("--frames", type=int, help="exit after N frames with a timing report")
+    parser.add_argument("--profile", action="store_true", help="print a cProfile report on exit")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main game loop"""
-    run_game()
+    args = parse_args(argv)
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    rng = None
+    if args.seed is not None:
+        random.seed(args.seed)
+        rng = random.Random(args.seed)
+    if args.fps_cap is not None:
+        pacing.set_frame_cap(args.fps_cap)
+    if args.tier:
+        effects.governor.pin(args.tier)
+    
+    frames = FrameReport(args.frames)
+    if args.frames or args.profile:
+        display.add_frame_listener(frames.frame)
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    
+    try:
+        scene, at_screen = args.scene
+        run_game(scene, args.player_name, rng, at_screen)
+    except FrameLimitReached:
+        pass
+    finally:
+        if profiler:
+            import pstats
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+        if args.frames or args.profile:
+            print(frames.report())
     
     # Close game
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
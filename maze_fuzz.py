@@ -0,0 +1,224 @@
+"""
+Property fuzzer for the ALIEN: MUTHUR maze model
+
+Applies random key sequences to MazeModel and checks after every operation:
+    - each system's connected flag matches whether its path reached its target
+    - paths are contiguous, in bounds and clear of walls
+    - no cell is shared by two systems (crossings must reset the puzzle)
+    - backspace after a move restores the state from before the move
+
+Random keys rarely finish all three lines, so a directed phase follows:
+each game routes every system to its target along a clear path that keeps
+near its own row, from wherever a few random moves left it, checking the
+same invariants on the way and that the finished puzzle is won.
+
+Usage:
+    python maze_fuzz.py --ops 2000000 --games 2000 --seed 1
+"""
+
+import argparse
+import heapq
+import random
+import time
+from maze_model import MazeModel, SYSTEMS, DIRECTIONS, GRID_WIDTH, GRID_HEIGHT
+
+# Weighted key alphabet; rightward moves are favoured so paths reach targets
+KEYS = (['up', 'down', 'left'] * 2 + ['right'] * 5 +
+        ['backspace'] * 2 + SYSTEMS + ['next'])
+RESET_EVERY = 5000  # Start a fresh puzzle now and then
+FULL_CHECK_EVERY = 500  # Other operations only touch the current system
+MAX_DETOUR = 10  # Random moves before a directed game routes a system
+LANE_WEIGHT = 2  # Routing cost per row away from a system's own row, so one
+                 # system's shortest path doesn't wall the others in
+
+
+class InvariantError(AssertionError):
+    pass
+
+
+def check_invariants(model, systems=SYSTEMS):
+    for system in systems:
+        line = model.lines[system]
+        path = line['path']
+        if path[0] != model.start_positions[system]:
+            raise InvariantError(f"{system} path does not start at its start square")
+        if line['connected'] != (model.target_positions[system] in line['cells']):
+            raise InvariantError(f"{system} connected flag does not match its path")
+        if line['cells'] != set(path) or len(path) != len(line['cells']):
+            raise InvariantError(f"{system} path revisits a cell")
+        for (x0, y0), (x1, y1) in zip(path, path[1:]):
+            if abs(x1 - x0) + abs(y1 - y0) != 1:
+                raise InvariantError(f"{system} path is not contiguous")
+        for cell in path[1:]:
+            if not (0 <= cell[0] < GRID_WIDTH and 0 <= cell[1] < GRID_HEIGHT):
+                raise InvariantError(f"{system} path leaves the grid")
+            if cell in model.blocked:
+                raise InvariantError(f"{system} path runs through a wall")
+            owner = model.occupied.get(cell)
+            if owner != system:
+                raise InvariantError(f"{system} overlaps {owner} at {cell}")
+    claimed = sum(len(line['path']) - 1 for line in model.lines.values())
+    if claimed != len(model.occupied):
+        raise InvariantError("occupancy index out of sync with paths")
+
+
+def snapshot(model):
+    """Everything a move and its undo could touch: every line and the occupancy index"""
+    lines = tuple((tuple(line['path']), line['connected']) for line in model.lines.values())
+    return model.current_line, lines, dict(model.occupied)
+
+
+def checked_move(model, key, rng, stats):
+    """Move the current system, sometimes undoing it to check the undo
+
+    Returns:
+        True if the path moved and was kept
+    """
+    before = snapshot(model)
+    if not model.move(key):
+        return False
+    stats['moves'] += 1
+    if len(model.lines[model.current_line]['path']) == 1:
+        stats['crossing_resets'] += 1
+        return True
+    if rng.random() < 0.25:
+        model.backspace()
+        if snapshot(model) != before:
+            raise InvariantError(f"undo did not restore state after {key}")
+        stats['undos_checked'] += 1
+        return False
+    return True
+
+
+def route(model, system):
+    """Keys for a clear path from system's head to its target, or None
+
+    Avoids walls, every claimed cell and the other systems' end squares, and
+    keeps close to the system's own row.
+    """
+    line = model.lines[system]
+    head = line['path'][-1]
+    target = model.target_positions[system]
+    avoid = model.blocked | set(model.occupied) | line['cells']
+    for other in SYSTEMS:
+        if other != system:
+            avoid.add(model.start_positions[other])
+            avoid.add(model.target_positions[other])
+    came_from = {head: None}
+    cost = {head: 0}
+    queue = [(0, head)]
+    while queue:
+        spent, cell = heapq.heappop(queue)
+        if cell == target:
+            keys = []
+            while came_from[cell] is not None:
+                cell, key = came_from[cell]
+                keys.append(key)
+            return keys[::-1]
+        if spent > cost[cell]:
+            continue
+        for key, (dx, dy) in DIRECTIONS.items():
+            step = (cell[0] + dx, cell[1] + dy)
+            if step in avoid or not (0 <= step[0] < GRID_WIDTH and 0 <= step[1] < GRID_HEIGHT):
+                continue
+            step_cost = spent + 1 + LANE_WEIGHT * abs(step[1] - target[1])
+            if step_cost < cost.get(step, step_cost + 1):
+                cost[step] = step_cost
+                came_from[step] = (cell, key)
+                heapq.heappush(queue, (step_cost, step))
+    return None
+
+
+def directed(games, rng, stats):
+    """Play games that route each system to its target, checking as they go"""
+    model = MazeModel()
+    for _ in range(games):
+        model.reset()
+        systems = SYSTEMS[:]
+        rng.shuffle(systems)
+        for system in systems:
+            model.switch(system)
+            for _ in range(rng.randrange(MAX_DETOUR)):
+                checked_move(model, rng.choice(['up', 'down', 'left', 'right']), rng, stats)
+                check_invariants(model)
+            if model.lines[system]['connected']:
+                continue
+            keys = route(model, system)
+            if keys is None:
+                # The detour walled this system in; go back to the start square
+                while model.backspace():
+                    pass
+                keys = route(model, system)
+            if keys is None:
+                break
+            for key in keys:
+                if not model.move(key):
+                    raise InvariantError(f"{system} refused a clear move {key}")
+                stats['moves'] += 1
+                check_invariants(model)
+            if not model.lines[system]['connected']:
+                raise InvariantError(f"{system} reached its target but is not connected")
+        if all(model.lines[system]['connected'] for system in SYSTEMS):
+            if not model.won:
+                raise InvariantError("all systems connected but the puzzle is not won")
+            stats['wins'] += 1
+        else:
+            stats['unroutable'] += 1
+
+
+def fuzz(ops, seed):
+    """Apply ops random keys to a model, checking invariants after each
+
+    Returns:
+        Dict of counters
+    """
+    rng = random.Random(seed)
+    model = MazeModel()
+    keys = [rng.choice(KEYS) for _ in range(ops)]
+    stats = {'moves': 0, 'crossing_resets': 0, 'undos_checked': 0, 'wins': 0, 'unroutable': 0}
+    last_resets = 0
+
+    for i, key in enumerate(keys):
+        if i % RESET_EVERY == 0:
+            model.reset()
+
+        if key in ('up', 'down', 'left', 'right'):
+            checked_move(model, key, rng, stats)
+        elif key == 'backspace':
+            model.backspace()
+        else:
+            model.switch(key)
+
+        if i % FULL_CHECK_EVERY == 0 or stats['crossing_resets'] != last_resets:
+            check_invariants(model)
+            last_resets = stats['crossing_resets']
+        else:
+            check_invariants(model, (model.current_line,))
+        if model.won:
+            stats['wins'] += 1
+            model.reset()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MazeModel property fuzzer")
+    parser.add_argument("--ops", type=int, default=1000000)
+    parser.add_argument("--games", type=int, default=1000, help="directed games after the random ops")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = fuzz(args.ops, args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"{args.ops} operations in {elapsed:.1f} s "
+          f"({args.ops / max(elapsed, 1e-9) * 60 / 1e6:.1f} M ops/min), all invariants held")
+
+    start = time.perf_counter()
+    directed(args.games, random.Random(args.seed), stats)
+    elapsed = time.perf_counter() - start
+    print(f"{args.games} directed games in {elapsed:.1f} s, all invariants held")
+    for name, count in stats.items():
+        print(f"  {name}: {count}")
+
+if __name__ == "__main__":
+    main()
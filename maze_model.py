@@ -0,0 +1,187 @@
+"""
+Pygame-free maze routing model for ALIEN: MUTHUR
+
+Holds the wall layout and the three system paths, and applies the move,
+switch, backspace and reset operations of the routing puzzle. scenes/maze.py
+is a view over it; maze_fuzz.py drives it directly.
+"""
+
+# Grid size, mirrored from config.py so the model stays pygame-free
+GRID_WIDTH = 50
+GRID_HEIGHT = 25
+
+SYSTEMS = ['power', 'data', 'coolant']
+
+DIRECTIONS = {
+    'up': (0, -1),
+    'down': (0, 1),
+    'left': (-1, 0),
+    'right': (1, 0),
+}
+
+def add_wall_segments(walls, wall_type, positions):
+    """Helper to add multiple wall segments of same type"""
+    for x, y, length in positions:
+        walls.append((wall_type, x, y, length))
+
+def create_maze_walls():
+    """Generate the maze wall structure"""
+    walls = []
+    
+    # Border walls with gaps for entry/exit points
+    border_walls = [
+        ('h', 0, 0, 50),
+        ('h', 0, 24, 50),
+        ('v', 0, 0, 6), ('v', 0, 7, 5), ('v', 0, 13, 5), ('v', 0, 19, 6),
+        ('v', 49, 0, 6), ('v', 49, 7, 5), 
+        ('v', 49, 13, 5), ('v', 49, 19, 6)
+    ]
+    walls.extend(border_walls)
+    
+    # Horizontal corridors
+    corridor_patterns = [
+        (2, [(3,3), (8,3), (13,3), (18,3), (23,3), (28,3), (33,3), (38,3), (43,4)]),
+        (5, [(4,3), (9,3), (14,3), (19,3), (24,3), (29,3), (34,3), (39,3), (44,3)]),
+        (8, [(5,3), (10,3), (15,3), (20,3), (25,3), (30,3), (35,3), (40,3), (45,2)]),
+        (12, [(6,2), (11,2), (16,2), (21,2), (26,2), (31,2), (36,2), (41,2), (46,1)]),
+        (16, [(4,3), (9,3), (14,3), (19,3), (24,3), (29,3), (34,3), (39,3), (44,3)]),
+        (19, [(3,3), (8,3), (13,3), (18,3), (23,3), (28,3), (33,3), (38,3), (43,4)]),
+        (22, [(5,3), (10,3), (15,3), (20,3), (25,3), (30,3), (35,3), (40,3), (45,2)])
+    ]
+    
+    for y, segments in corridor_patterns:
+        add_wall_segments(walls, 'h', [(x, y, length) for x, length in segments])
+    
+    # Vertical barriers
+    vertical_columns = [
+        (4, [(3,1), (6,1), (9,1), (12,1), (15,1), (18,1), (21,1)]),
+        (7, [(1,1), (4,1), (7,1), (10,1), (13,1), (16,1), (19,1), (22,1)]),
+        (11, [(1,1), (4,1), (7,1), (10,1), (13,1), (16,1), (19,1), (22,1)]),
+        (15, [(2,1), (5,1), (8,1), (11,1), (14,1), (17,1), (20,1), (23,1)]),
+        (19, [(1,1), (4,1), (7,1), (10,1), (13,1), (16,1), (19,1), (22,1)]),
+        (23, [(2,1), (5,1), (8,1), (11,1), (14,1), (17,1), (20,1), (23,1)]),
+        (27, [(1,1), (4,1), (7,1), (10,1), (13,1), (16,1), (19,1), (22,1)]),
+        (31, [(2,1), (5,1), (8,1), (11,1), (14,1), (17,1), (20,1), (23,1)]),
+        (35, [(1,1), (4,1), (7,1), (10,1), (13,1), (16,1), (19,1), (22,1)]),
+        (39, [(2,1), (5,1), (8,1), (11,1), (14,1), (17,1), (20,1), (23,1)]),
+        (43, [(1,1), (4,1), (7,1), (10,1), (13,1), (16,1), (19,1), (22,1)]),
+        (47, [(2,1), (5,1), (8,1), (11,1), (14,1), (17,1), (20,1), (23,1)])
+    ]
+    
+    for x, segments in vertical_columns:
+        add_wall_segments(walls, 'v', [(x, y, length) for y, length in segments])
+    
+    # Additional vertical barriers
+    varied_barriers = [
+        ('v', 21, 21, 1),
+        ('v', 25, 1, 2), ('v', 25, 7, 1), ('v', 25, 11, 1), ('v', 25, 15, 2), ('v', 25, 21, 1),
+        ('v', 28, 2, 1), ('v', 28, 6, 2), ('v', 28, 11, 2), ('v', 28, 16, 1), ('v', 28, 20, 2),
+        ('v', 32, 1, 2), ('v', 32, 6, 1), ('v', 32, 10, 2), ('v', 32, 16, 1), ('v', 32, 20, 1),
+        ('v', 35, 2, 2), ('v', 35, 8, 1), ('v', 35, 13, 2), ('v', 35, 18, 1), ('v', 35, 22, 1),
+        ('v', 38, 1, 1), ('v', 38, 5, 2), ('v', 38, 10, 2), ('v', 38, 15, 1), ('v', 38, 19, 2),
+        ('v', 41, 3, 2), ('v', 41, 9, 1), ('v', 41, 14, 2), ('v', 41, 19, 1),
+        ('v', 44, 1, 2), ('v', 44, 6, 1), ('v', 44, 10, 2), ('v', 44, 15, 1), ('v', 44, 19, 1),
+        ('v', 47, 2, 1), ('v', 47, 6, 2), ('v', 47, 11, 1), ('v', 47, 15, 2), ('v', 47, 20, 1)
+    ]
+    walls.extend(varied_barriers)
+    
+    # Strategic longer walls
+    strategic_walls = [
+        ('h', 15, 3, 5), ('h', 30, 6, 4), ('h', 8, 10, 6), 
+        ('h', 35, 14, 5), ('h', 20, 18, 5), ('h', 40, 20, 4)
+    ]
+    walls.extend(strategic_walls)
+    
+    # Narrow passages
+    narrow_passages = [
+        ('v', 22, 9, 2), ('v', 36, 11, 2), ('v', 16, 15, 2), 
+        ('v', 30, 7, 2), ('v', 42, 17, 2)
+    ]
+    walls.extend(narrow_passages)
+    
+    return walls
+
+
+def wall_cells(walls):
+    """Set of grid cells covered by wall segments"""
+    cells = set()
+    for wall_type, x, y, length in walls:
+        for i in range(length):
+            cells.add((x + i, y) if wall_type == 'h' else (x, y + i))
+    return cells
+
+class MazeModel:
+    """State of the system routing puzzle"""
+    def __init__(self, walls=None):
+        self.walls = walls if walls is not None else create_maze_walls()
+        self.blocked = wall_cells(self.walls)
+        
+        self.start_positions = {'power': (1, 6), 'data': (1, 12), 'coolant': (1, 18)}
+        self.target_positions = {'power': (GRID_WIDTH - 2, 6), 'data': (GRID_WIDTH - 2, 12),
+                                 'coolant': (GRID_WIDTH - 2, 18)}
+        
+        self.lines = {}
+        self.current_line = 'power'
+        self.reset()
+    
+    def reset(self):
+        """Reset all system paths to starting positions"""
+        for key, start in self.start_positions.items():
+            self.lines[key] = {'path': [start], 'cells': {start}, 'connected': False}
+        # Cells claimed by each path, excluding the start squares
+        self.occupied = {}
+    
+    @property
+    def won(self):
+        return all(line['connected'] for line in self.lines.values())
+    
+    def switch(self, system):
+        """Select a system by name, or 'next' to cycle"""
+        if system == 'next':
+            current_idx = SYSTEMS.index(self.current_line)
+            system = SYSTEMS[(current_idx + 1) % len(SYSTEMS)]
+        changed = system != self.current_line
+        self.current_line = system
+        return changed
+    
+    def move(self, direction):
+        """Extend the current path one cell
+        
+        Returns:
+            True if the path moved. Crossing another system resets the puzzle.
+        """
+        dx, dy = DIRECTIONS[direction]
+        line = self.lines[self.current_line]
+        head = line['path'][-1]
+        new_head = (head[0] + dx, head[1] + dy)
+        
+        if not (0 <= new_head[0] < GRID_WIDTH and 0 <= new_head[1] < GRID_HEIGHT):
+            return False
+        if new_head in self.blocked or new_head in line['cells']:
+            return False
+        
+        line['path'].append(new_head)
+        line['cells'].add(new_head)
+        
+        # Check if reached target
+        if new_head == self.target_positions[self.current_line]:
+            line['connected'] = True
+        
+        # Check for overlap and reset if found
+        if new_head in self.occupied:
+            self.reset()
+        else:
+            self.occupied[new_head] = self.current_line
+        return True
+    
+    def backspace(self):
+        """Undo the last move of the current path"""
+        line = self.lines[self.current_line]
+        if len(line['path']) <= 1:
+            return False
+        removed_pos = line['path'].pop()
+        line['cells'].discard(removed_pos)
+        del self.occupied[removed_pos]
+        if removed_pos == self.target_positions[self.current_line]:
+            line['connected'] = False
+        return True
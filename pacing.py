@@ -0,0 +1,112 @@
+"""
+Frame pacing for ALIEN: MUTHUR scene loops
+
+Scenes that sit on a mostly static picture (credits, name prompt, the title's
+'PRESS ANY KEY', the airlock's end-of-game delay) don't need 60 fps. A
+FramePacer runs them at full rate while animating and at IDLE_FPS otherwise,
+sleeping in pygame.event.wait so input still wakes the loop at once.
+
+While the window is unfocused or minimised the pacer blocks inside events()
+until it comes back, so the scene's simulation and rendering both stop.
+ticks() is a millisecond clock that excludes those pauses, for simulations
+that time themselves (the airlock alien). FULLSCREEN_KEY toggles fullscreen
+in any paced scene.
+"""
+
+import pygame
+from config import FPS, IDLE_FPS, FULLSCREEN_KEY
+import display
+import effects
+
+# How often a paused loop wakes to check for events
+PAUSE_POLL_MS = 250
+
+# Frame cap for every scene loop (0 for uncapped); main.py --fps-cap sets it
+frame_cap = FPS
+
+def set_frame_cap(fps):
+    """Change the frame cap for loops started from now on"""
+    global frame_cap
+    frame_cap = fps
+    if fps:
+        effects.governor.target = 1.0 / fps
+
+class FramePacer:
+    """Frame clock with idle throttling and focus-aware pausing
+
+    Args:
+        fps: Frame cap while animating (default frame_cap; 0 for uncapped,
+             e.g. headless runs; uncapped loops never idle)
+        idle_fps: Frame rate while nothing animates
+    """
+    def __init__(self, fps=None, idle_fps=IDLE_FPS):
+        self.clock = pygame.time.Clock()
+        self.fps = frame_cap if fps is None else fps
+        self.idle_fps = idle_fps
+        self.focused = True
+        self.minimized = False
+        self.paused_ms = 0
+
+    @property
+    def paused(self):
+        return self.minimized or not self.focused
+
+    def track(self, event):
+        """Follow window focus and visibility"""
+        if event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+        elif event.type == pygame.WINDOWMINIMIZED:
+            self.minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED):
+            self.minimized = False
+
+    def events(self):
+        """Return this frame's events, first waiting out any pause"""
+        events = pygame.event.get()
+        for event in events:
+            self.track(event)
+            if event.type == pygame.KEYDOWN and event.key == FULLSCREEN_KEY:
+                display.toggle_fullscreen()
+
+        if self.paused:
+            pause_start = pygame.time.get_ticks()
+            while self.paused:
+                event = pygame.event.wait(PAUSE_POLL_MS)
+                if event.type == pygame.NOEVENT:
+                    continue
+                self.track(event)
+                events.append(event)
+                if event.type == pygame.QUIT:
+                    break
+            self.paused_ms += pygame.time.get_ticks() - pause_start
+            # Don't count the pause against the next frame
+            self.clock.tick()
+            effects.governor.skip()
+        return events
+
+    def ticks(self):
+        """Milliseconds since pygame.init(), not counting pauses"""
+        return pygame.time.get_ticks() - self.paused_ms
+
+    def tick(self, animating=True):
+        """End the frame, at full rate or idling until input or the idle frame is due"""
+        if animating or not self.fps:
+            return self.clock.tick(self.fps)
+
+        # Sleep until the next idle frame, waking early for input. The event
+        # is put back for the next frame's events().
+        elapsed = self.clock.tick()
+        timeout = 1000 // self.idle_fps - elapsed
+        # event.wait(0) blocks with no timeout; a frame that already ran long
+        # only polls
+        if timeout > 0:
+            event = pygame.event.wait(timeout)
+        else:
+            event = pygame.event.poll()
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+        # Idle frames are slow on purpose; keep them out of the quality governor
+        effects.governor.skip()
+        return elapsed + self.clock.tick()
@@ -0,0 +1,67 @@
+"""
+Frame pacing check for ALIEN: MUTHUR
+
+Runs FramePacer headless through the cases that have hung or stalled idle
+screens: an idle tick after a frame that overran the idle interval, and an
+idle tick with input waiting. Fails (exit code 1) if any tick takes longer
+than MAX_TICK_MS.
+
+Usage:
+    python pacing_check.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from pacing import FramePacer
+
+# Generous bound for one idle tick (the idle interval is 100 ms)
+MAX_TICK_MS = 500
+# A watchdog event unblocks a tick that would otherwise wait for input forever
+WATCHDOG_MS = MAX_TICK_MS * 4
+
+def timed_tick(pacer, frame_ms, post_event=False):
+    """Spend frame_ms on a 'frame', then time an idle tick"""
+    pacer.tick()
+    time.sleep(frame_ms / 1000)
+    if post_event:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode="a"))
+    pygame.time.set_timer(pygame.USEREVENT, WATCHDOG_MS, loops=1)
+    start = time.perf_counter()
+    pacer.tick(animating=False)
+    elapsed = (time.perf_counter() - start) * 1000
+    pygame.time.set_timer(pygame.USEREVENT, 0)
+    pygame.event.clear()
+    return elapsed
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    pygame.event.clear()
+    pacer = FramePacer()
+
+    cases = [
+        ("fast frame", 5, False),
+        ("slow frame (120 ms)", 120, False),
+        ("frame exactly one idle interval", 1000 // pacer.idle_fps, False),
+        ("fast frame, input waiting", 5, True),
+    ]
+    status = 0
+    for name, frame_ms, post_event in cases:
+        ms = timed_tick(pacer, frame_ms, post_event)
+        ok = ms <= MAX_TICK_MS
+        status |= not ok
+        print(f"{name:<34} idle tick {ms:7.1f} ms  {'ok' if ok else 'FAIL'}")
+
+    print("Pacing:", "PASS" if status == 0 else "FAIL")
+    pygame.quit()
+    sys.exit(status)
+
+if __name__ == "__main__":
+    main()
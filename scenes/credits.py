@@ -6,15 +6,16 @@ import pygame
 import sys
 import webbrowser
 from config import WIDTH, HEIGHT, TERMINAL_GREEN, BRIGHT_GREEN, TERMINAL_BLACK, load_fonts
+import display
+from pacing import FramePacer
+from compositor import StaticScreen
 
 def run_credits_screen():
     """Display credits screen with option to replay or quit"""
-    pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("ALIEN: MUTHER - Credits")
+    display.begin_scene("ALIEN: MUTHER - Credits")
     
     font_large, font_medium, font_small = load_fonts()
-    clock = pygame.time.Clock()
+    pacer = FramePacer()
     
     # Credits content
     credits_lines = [
@@ -42,12 +43,21 @@ def run_credits_screen():
         ("Press ESC to Quit", font_small, TERMINAL_GREEN, HEIGHT - 35),
     ]
     
-    link_rect = None
+    # Bake the static layout once; the link keeps its rect for clicks
+    credits_screen = StaticScreen()
+    for text, font, color, y_pos in credits_lines:
+        if text:  # Skip empty lines
+            name = "link" if "linkedin.com" in text else None
+            credits_screen.text(text, font, color, name, center=(WIDTH // 2, y_pos))
+    for text, font, color, y_pos in controls_lines:
+        credits_screen.text(text, font, color, center=(WIDTH // 2, y_pos))
+    
+    link_rect = credits_screen.rects.get("link")
     link_url = "https://www.linkedin.com/in/mark-bonington"
     
     waiting = True
     while waiting:
-        for event in pygame.event.get():
+        for event in pacer.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -56,30 +66,14 @@ def run_credits_screen():
                     pygame.quit()
                     sys.exit()
                 elif event.key == pygame.K_r:
+                    credits_screen.release()
                     return "replay"
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                if link_rect and link_rect.collidepoint(event.pos):
+                if link_rect and link_rect.collidepoint(display.to_logical(event.pos)):
                     webbrowser.open(link_url)
         
-        screen.fill(TERMINAL_BLACK)
-        
-        # Draw credits
-        for text, font, color, y_pos in credits_lines:
-            if text:  # Skip empty lines
-                text_surface = font.render(text, True, color)
-                text_rect = text_surface.get_rect(center=(WIDTH // 2, y_pos))
-                screen.blit(text_surface, text_rect)
-                if "linkedin.com" in text:
-                    link_rect = text_rect
-        
-        # Draw controls
-        for text, font, color, y_pos in controls_lines:
-            text_surface = font.render(text, True, color)
-            text_rect = text_surface.get_rect(center=(WIDTH // 2, y_pos))
-            screen.blit(text_surface, text_rect)
-        
-        pygame.display.flip()
-        clock.tick(60)
+        credits_screen.present()
+        pacer.tick(animating=False)
 
 
 # """
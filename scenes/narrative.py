@@ -4,14 +4,26 @@ Narrative sequencing for ALIEN: MUTHUR
 Player enters name
 Tone and stakes are established
 Warning message and timer are initiated
+
+The screens themselves are data in scenes/story.py, compiled once into a
+flat timeline; play() runs any chapter, or any screen within one, directly,
+and play_through() follows the script from one chapter into the next.
 """
 
 import pygame
 import sys
 import time
+from collections import namedtuple
 from config import WIDTH, HEIGHT, TERMINAL_GREEN, BRIGHT_GREEN, TERMINAL_BLACK, load_fonts
-from engine import TypingText, apply_crt_effects, green_flash, wait_for_time, display_typing_sequence
-from scenes.dialogue import OPENING_DIALOGUE, MAZE_DIALOGUE, NAVIGATION_DIALOGUE, AIRLOCK_DIALOGUE, VICTORY_DIALOGUE
+import display
+import warmup
+import pacing
+from pacing import FramePacer
+from widgets import TextField, TextLabel, key_repeat
+from engine import TypingText, apply_crt_effects, green_flash, wait_for_time, type_dialogue
+from scenes import dialogue
+from scenes.dialogue import OPENING_DIALOGUE
+from scenes.story import CHAPTERS
 from scenes.win import run_shutdown_sequence
 from scenes.lose import run_game_over_sequence
 
@@ -19,7 +31,6 @@ def get_player_name(screen, y_position=100):
     """Get player name input"""
     font_large, _, _ = load_fonts()
     clock = pygame.time.Clock()
-    input_text = ""
     
     prompt = TypingText(
         OPENING_DIALOGUE["player_input"]["prompt"],
@@ -40,319 +51,198 @@ def get_player_name(screen, y_position=100):
         screen.fill(TERMINAL_BLACK)
         prompt.draw(screen)
         apply_crt_effects(screen)
-        pygame.display.flip()
-        clock.tick(60)
-    
-    # Get input
-    input_active = True
-    error_message = ""
-    
-    while input_active:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
+        display.present(screen)
+        clock.tick(pacing.frame_cap)
+    
+    # Get input; the prompt is static apart from the CRT effects, so idle
+    name_field = TextField(font_large, TERMINAL_GREEN)
+    error_label = TextLabel(font_large, TERMINAL_GREEN)
+    pacer = FramePacer()
+    
+    with key_repeat():
+        while True:
+            for event in pacer.events():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                
+                action = name_field.handle_event(event)
+                if action == "submit":
                     # Validate input
+                    input_text = name_field.submit()
                     if input_text.strip() and input_text.replace(" ", "").replace("-", "").replace("'", "").isalpha():
                         return input_text
                     else:
-                        error_message = OPENING_DIALOGUE["player_input"]["error"]
-                        input_text = ""
-                elif event.key == pygame.K_BACKSPACE:
-                    input_text = input_text[:-1]
-                    error_message = ""
-                elif event.unicode.isprintable():
-                    input_text += event.unicode
-                    error_message = ""
-        
-        # Draw
-        screen.fill(TERMINAL_BLACK)
-        prompt.draw(screen)
-        
-        # Draw input text
-        input_surface = font_large.render(input_text + "_", True, TERMINAL_GREEN)
-        screen.blit(input_surface, (50, y_position + 40))
-        
-        # Draw error if any
-        if error_message:
-            error_surface = font_large.render(error_message, True, TERMINAL_GREEN)
-            screen.blit(error_surface, (50, y_position + 80))
-        
-        apply_crt_effects(screen)
-        pygame.display.flip()
-        clock.tick(60)
-
-def run_opening(screen):
-    """Run the opening sequence and return player name"""
-    font_large, _, _ = load_fonts()
-    
-    # Consistent top position for all text blocks
-    TOP_POSITION = 100
-    
-    # Helper function to convert dialogue to list
-    def to_list(dialogue):
-        return [dialogue] if isinstance(dialogue, str) else dialogue
-    
-    # Initialization
-    texts = display_typing_sequence(
-        [(line, font_large) for line in to_list(OPENING_DIALOGUE["initialization"])],
-        screen,
-        TOP_POSITION
-    )
-    wait_for_time(2, screen, texts)
-    green_flash(screen)
-    
-    # Diagnostics
-    screen.fill(TERMINAL_BLACK)
-    texts = display_typing_sequence(
-        [(line, font_large) for line in to_list(OPENING_DIALOGUE["diagnostics"])],
-        screen,
-        TOP_POSITION
-    )
-    wait_for_time(1.5, screen, texts)
-    green_flash(screen)
-    
-    # Ship info
-    screen.fill(TERMINAL_BLACK)
-    texts = display_typing_sequence(
-        [(line, font_large) for line in OPENING_DIALOGUE["ship_info"]],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(1, screen, texts)
-    green_flash(screen)
-    
-    # Get player name
-    screen.fill(TERMINAL_BLACK)
-    player_name = get_player_name(screen, TOP_POSITION)
-    wait_for_time(1, screen, [])
-    green_flash(screen)
-    
-    # Player match (with name substitution)
-    screen.fill(TERMINAL_BLACK)
-    player_match_lines = [
-        line.format(player_name=player_name) for line in OPENING_DIALOGUE["player_match"]
-    ]
-    texts = display_typing_sequence(
-        [(line, font_large) for line in player_match_lines],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(2, screen, texts)
-    green_flash(screen)
-    
-    # Warning
-    screen.fill(TERMINAL_BLACK)
-    texts = display_typing_sequence(
-        [(line, font_large) for line in OPENING_DIALOGUE["warning"]],
-        screen,
-        TOP_POSITION,
-        40,
-        line_pauses={1: 2}
-    )
-    wait_for_time(4, screen, texts)
-    green_flash(screen)
+                        error_label.set(OPENING_DIALOGUE["player_input"]["error"])
+                elif action == "edit":
+                    error_label.set("")
+            
+            # Draw
+            screen.fill(TERMINAL_BLACK)
+            prompt.draw(screen)
+            name_field.draw(screen, (50, y_position + 40))
+            error_label.draw(screen, (50, y_position + 80))
+            
+            apply_crt_effects(screen)
+            display.present(screen)
+            pacer.tick(animating=False)
+
+# Story interpreter: scenes/story.py compiled to a flat, seekable timeline
+
+TOP_POSITION = 100  # Consistent top position for all text blocks
+LINE_SPACING = 40
+
+# Scripted sequences a story screen can hand over to
+SEQUENCES = {
+    "game_over": run_game_over_sequence,
+    "shutdown": run_shutdown_sequence,
+}
+SCREEN_KEYS = {"say", "ask_name", "spacing", "pauses", "hold", "flash", "sequence"}
+
+# One interpreter step: op is clear, say, ask_name, hold, flash or sequence
+Step = namedtuple("Step", "op arg")
+
+def resolve_block(reference, where):
+    """The dialogue block for a "TABLE.key" reference"""
+    table_name, _, key = reference.partition(".")
+    table = getattr(dialogue, table_name, None)
+    if not isinstance(table, dict) or key not in table:
+        raise ValueError(f"{where}: unknown dialogue block {reference!r}")
+    return table[key]
+
+def compile_screen(screen, where):
+    """Steps for one story screen, with every reference resolved up front"""
+    unknown = set(screen) - SCREEN_KEYS
+    if unknown:
+        raise ValueError(f"{where}: unknown keys {sorted(unknown)}")
+    shows_text = "say" in screen or screen.get("ask_name", False)
+    steps = []
+    if shows_text:
+        steps.append(Step("clear", None))
+    if "say" in screen:
+        block = resolve_block(screen["say"], where)
+        steps.append(Step("say", (block, screen.get("spacing", LINE_SPACING), screen.get("pauses"))))
+    if screen.get("ask_name"):
+        steps.append(Step("ask_name", None))
+    if "hold" in screen:
+        steps.append(Step("hold", screen["hold"]))
+    if screen.get("flash", shows_text):
+        steps.append(Step("flash", None))
+    if "sequence" in screen:
+        if screen["sequence"] not in SEQUENCES:
+            raise ValueError(f"{where}: unknown sequence {screen['sequence']!r}")
+        steps.append(Step("sequence", SEQUENCES[screen["sequence"]]))
+    return steps
+
+class Timeline:
+    """The whole story as one flat list of pre-parsed steps
+
+    Each chapter is a slice of the list and each of its screens starts at a
+    recorded index, so starting a chapter, seeking to a screen or skipping
+    to the next chapter is a lookup rather than a replay.
+    """
+    def __init__(self, chapters):
+        self.steps = []
+        self.chapters = {}   # chapter -> (first step, end step)
+        self.screens = {}    # chapter -> first step of each screen
+        self.order = list(chapters)
+        for name, screens in chapters.items():
+            start = len(self.steps)
+            self.screens[name] = []
+            for number, screen in enumerate(screens):
+                self.screens[name].append(len(self.steps))
+                self.steps.extend(compile_screen(screen, f"{name}[{number}]"))
+            self.chapters[name] = (start, len(self.steps))
+        self.positions = {name: i for i, name in enumerate(self.order)}
+
+    def following(self, chapter):
+        """The chapter after this one, or None at the end of the story"""
+        index = self.positions[chapter] + 1
+        return self.order[index] if index < len(self.order) else None
+
+_timeline = None
+
+def story():
+    """The compiled story, built on first use"""
+    global _timeline
+    if _timeline is None:
+        _timeline = Timeline(CHAPTERS)
+    return _timeline
+
+def play(chapter, screen, player_name=None, at_screen=0):
+    """Run a chapter of the story, optionally from one of its screens
+
+    Returns:
+        The player name, as given or as entered at an ask_name screen
+    """
+    timeline = story()
+    start, end = timeline.chapters[chapter]
+    if at_screen:
+        start = timeline.screens[chapter][at_screen]
+    texts = []
+    for index in range(start, end):
+        op, arg = timeline.steps[index]
+        if op == "clear":
+            screen.fill(TERMINAL_BLACK)
+            texts = []
+        elif op == "say":
+            block, line_spacing, line_pauses = arg
+            texts = type_dialogue(block, screen, player_name, TOP_POSITION, line_spacing, line_pauses)
+        elif op == "ask_name":
+            player_name = get_player_name(screen, TOP_POSITION)
+            warmup.schedule_player_dialogue(player_name)
+        elif op == "hold":
+            wait_for_time(arg, screen, texts)
+        elif op == "flash":
+            green_flash(screen)
+        elif op == "sequence":
+            arg(screen)
+    return player_name
 
-    # Special order 937
-    screen.fill(TERMINAL_BLACK)
-    order_937_lines = [
-        line.format(player_name=player_name) for line in OPENING_DIALOGUE["order_937"]
-    ]
-    texts = display_typing_sequence(
-        [(line, font_large) for line in order_937_lines],
-        screen,
-        TOP_POSITION,
-        40,
-        line_pauses={0: 1}
-    )
-    wait_for_time(3, screen, texts)
-    green_flash(screen)
-    
-    # Maze
-    screen.fill(TERMINAL_BLACK)
-    texts = display_typing_sequence(
-        [(line, font_large) for line in MAZE_DIALOGUE["timer_mazeintro"]],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(2, screen, texts)
-    
+def play_through(chapter, until, screen, player_name=None, at_screen=0):
+    """Run chapters in script order, from chapter up to (not including) until
+
+    Chapters added to the script between the two are played without code
+    changes. at_screen applies to the first chapter.
+    """
+    timeline = story()
+    while chapter is not None and chapter != until:
+        player_name = play(chapter, screen, player_name, at_screen)
+        chapter = timeline.following(chapter)
+        at_screen = 0
     return player_name
 
+def run_opening(screen, player_name=None, at_screen=0):
+    """Run the opening sequence and return player name
+
+    Starting past the name prompt keeps the player_name given.
+    """
+    return play("opening", screen, player_name, at_screen)
+
 
 # MAZE GAME RUNS
 
 # Maze completion dialogue
 def run_maze_completion(screen, player_name):
-    font_large, _, _ = load_fonts()
-    TOP_POSITION = 100
-
-    # Part 1
-    part1_lines = [line.format(player_name=player_name) for line in MAZE_DIALOGUE["maze_completion_1"]]
-    screen.fill(TERMINAL_BLACK)
-    texts1 = display_typing_sequence(
-        [(line, font_large) for line in part1_lines],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(3, screen, texts1)
-    green_flash(screen)
-
-    # New screen for the warning
-    screen.fill(TERMINAL_BLACK)
-    part2_lines = [line.format(player_name=player_name) for line in MAZE_DIALOGUE["maze_completion_2"]]
-    texts2 = display_typing_sequence(
-        [(line, font_large) for line in part2_lines],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(4, screen, texts2)
-    green_flash(screen)
-
+    play("maze_completion", screen, player_name)
 
 def run_navigation_dialogue(screen, player_name):
-    font_large, _, _ = load_fonts()
-    TOP_POSITION = 100
-
-    # Part 1
-    part1_lines = [line.format(player_name=player_name) for line in NAVIGATION_DIALOGUE["nav_dialogue_1"]]
-    screen.fill(TERMINAL_BLACK)
-    texts1 = display_typing_sequence(
-        [(line, font_large) for line in part1_lines],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(3, screen, texts1)
-    green_flash(screen)
+    play("navigation", screen, player_name)
 
-    # New screen for the warning
-    screen.fill(TERMINAL_BLACK)
-    part2_lines = [line.format(player_name=player_name) for line in NAVIGATION_DIALOGUE["nav_dialogue_2"]]
-    texts2 = display_typing_sequence(
-        [(line, font_large) for line in part2_lines],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(4, screen, texts2)
-    green_flash(screen)
+def run_maze_to_airlock(screen, player_name, first="maze_completion", at_screen=0):
+    """The story between the maze and the airlock: maze completion, then navigation"""
+    play_through(first, "airlock_intro", screen, player_name, at_screen)
 
 def run_airlock_intro(screen):
     """Display airlock puzzle introduction"""
-    font_large, _, _ = load_fonts()
-    TOP_POSITION = 100
-    
-    screen.fill(TERMINAL_BLACK)
-    texts = display_typing_sequence(
-        [(line, font_large) for line in AIRLOCK_DIALOGUE["airlock_intro"]],
-        screen,
-        TOP_POSITION,
-        40,
-        line_pauses={2: 1.5, 5: 1.0}
-    )
-    wait_for_time(2, screen, texts)
-    green_flash(screen)
+    play("airlock_intro", screen)
 
 def run_airlock_ending(screen, player_name, outcome):
-    """Display the airlock puzzle ending based on outcome"""
-    from scenes.dialogue import AIRLOCK_DIALOGUE
-    
-    font_large, _, _ = load_fonts()
-    TOP_POSITION = 100
-    
-    screen.fill(TERMINAL_BLACK)
-    
-    if outcome == "victory":
-        ending_lines = [line.format(player_name=player_name) 
-                       for line in AIRLOCK_DIALOGUE["airlock_victory"]]
-    else:
-        ending_lines = [line.format(player_name=player_name) 
-                       for line in AIRLOCK_DIALOGUE["airlock_failure"]]
-    
-    texts = display_typing_sequence(
-        [(line, font_large) for line in ending_lines],
-        screen,
-        TOP_POSITION,
-        40,
-        line_pauses={1: 1.5, 4: 1.0}
-    )
-    wait_for_time(5, screen, texts)
-    green_flash(screen)
-
-    # Run game over sequence if player lost
-    if outcome == "failure":
-        run_game_over_sequence(screen)
+    """Display the airlock puzzle ending based on outcome (game over follows a failure)"""
+    play(f"airlock_{outcome}", screen, player_name)
 
 
 # WIN DIALOGUE
-def run_victory_narrative(screen, player_name):
-    """Display final victory narrative before win screen"""
-    font_large, _, _ = load_fonts()
-    TOP_POSITION = 100
-    
-    # Victory confirmation
-    screen.fill(TERMINAL_BLACK)
-    victory_confirmation_lines = [
-        line.format(player_name=player_name) for line in VICTORY_DIALOGUE["victory_confirmation"]
-    ]
-    texts = display_typing_sequence(
-        [(line, font_large) for line in victory_confirmation_lines],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(2, screen, texts)
-    green_flash(screen)
-    
-    # Scanning ship
-    screen.fill(TERMINAL_BLACK)
-    scanning_ship_lines = [
-        line.format(player_name=player_name) for line in VICTORY_DIALOGUE["scanning_ship"]
-    ]
-    texts = display_typing_sequence(
-        [(line, font_large) for line in scanning_ship_lines],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(3, screen, texts)
-    green_flash(screen)
-    
-    # Plot twist
-    screen.fill(TERMINAL_BLACK)
-    eggs_twist_lines = [
-        line.format(player_name=player_name) for line in VICTORY_DIALOGUE["eggs_twist"]
-    ]
-    texts = display_typing_sequence(
-        [(line, font_large) for line in eggs_twist_lines],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(3, screen, texts)
-    green_flash(screen)
-    
-    # Thank you
-    screen.fill(TERMINAL_BLACK)
-    thank_you_lines = [
-        line.format(player_name=player_name) for line in VICTORY_DIALOGUE["thank_you"]
-    ]
-    texts = display_typing_sequence(
-        [(line, font_large) for line in thank_you_lines],
-        screen,
-        TOP_POSITION,
-        40
-    )
-    wait_for_time(2, screen, texts)
-    green_flash(screen)
-
-    # Run shutdown sequence
-    run_shutdown_sequence(screen)
+def run_victory_narrative(screen, player_name, at_screen=0):
+    """Display final victory narrative, then the shutdown sequence"""
+    play("victory", screen, player_name, at_screen)
@@ -0,0 +1,61 @@
+"""
+Narrative script for ALIEN: MUTHUR
+
+The story between the puzzles, as data: each chapter is a list of screens,
+played in order by the interpreter in scenes/narrative.py. A screen is a
+dict of:
+
+    say       - dialogue block to type, as "TABLE.key" in scenes/dialogue.py;
+                {player_name} is filled in
+    ask_name  - True to prompt for the player's name instead
+    spacing   - line spacing (default 40)
+    pauses    - {line_index: seconds} to pause after a line
+    hold      - seconds to keep the finished screen up
+    flash     - green flash before the next screen (default True for
+                screens that show text)
+    sequence  - hand over to a scripted sequence: "game_over" or "shutdown"
+"""
+
+CHAPTERS = {
+    "opening": [
+        {"say": "OPENING_DIALOGUE.initialization", "hold": 2},
+        {"say": "OPENING_DIALOGUE.diagnostics", "hold": 1.5},
+        {"say": "OPENING_DIALOGUE.ship_info", "hold": 1},
+        {"ask_name": True, "hold": 1},
+        {"say": "OPENING_DIALOGUE.player_match", "hold": 2},
+        {"say": "OPENING_DIALOGUE.warning", "pauses": {1: 2}, "hold": 4},
+        {"say": "OPENING_DIALOGUE.order_937", "pauses": {0: 1}, "hold": 3},
+        {"say": "MAZE_DIALOGUE.timer_mazeintro", "hold": 2, "flash": False},
+    ],
+
+    "maze_completion": [
+        {"say": "MAZE_DIALOGUE.maze_completion_1", "hold": 3},
+        {"say": "MAZE_DIALOGUE.maze_completion_2", "hold": 4},
+    ],
+
+    "navigation": [
+        {"say": "NAVIGATION_DIALOGUE.nav_dialogue_1", "hold": 3},
+        {"say": "NAVIGATION_DIALOGUE.nav_dialogue_2", "hold": 4},
+    ],
+
+    "airlock_intro": [
+        {"say": "AIRLOCK_DIALOGUE.airlock_intro", "pauses": {2: 1.5, 5: 1.0}, "hold": 2},
+    ],
+
+    "airlock_victory": [
+        {"say": "AIRLOCK_DIALOGUE.airlock_victory", "pauses": {1: 1.5, 4: 1.0}, "hold": 5},
+    ],
+
+    "airlock_failure": [
+        {"say": "AIRLOCK_DIALOGUE.airlock_failure", "pauses": {1: 1.5, 4: 1.0}, "hold": 5},
+        {"sequence": "game_over"},
+    ],
+
+    "victory": [
+        {"say": "VICTORY_DIALOGUE.victory_confirmation", "hold": 2},
+        {"say": "VICTORY_DIALOGUE.scanning_ship", "hold": 3},
+        {"say": "VICTORY_DIALOGUE.eggs_twist", "hold": 3},
+        {"say": "VICTORY_DIALOGUE.thank_you", "hold": 2},
+        {"sequence": "shutdown"},
+    ],
+}
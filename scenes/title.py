@@ -6,59 +6,74 @@ import pygame
 import sys
 import time
 import random
-from config import WIDTH, HEIGHT, TERMINAL_GREEN, BRIGHT_GREEN, DIM_GREEN, TERMINAL_BLACK, load_fonts
+from array import array
+from config import WIDTH, HEIGHT, TERMINAL_GREEN, BRIGHT_GREEN, DIM_GREEN, TERMINAL_BLACK, load_fonts, load_font
+import display
+from effects import heavy_static_effect, scanline_effect, flicker_effect, glitch_text
+import warmup
 from engine import green_flash
+import pacing
+from pacing import FramePacer
+import startup
 
-def heavy_static_effect(surface, intensity=200):
-    """Create heavy static interference"""
-    for _ in range(intensity):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT)
-        brightness = random.randint(50, 255)
-        color = (0, brightness, 0)
-        size = random.randint(1, 3)
-        pygame.draw.circle(surface, color, (x, y), size)
+# Boot sequence line pool and ring buffer sizes
+BOOT_POOL_SIZE = 64
+BOOT_MAX_LINES = 35
+BOOT_FADE_STEP = 3
 
-def scanline_effect(surface):
-    """Draw horizontal scanlines across screen"""
-    scanline_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    for y in range(0, HEIGHT, 3):
-        alpha = random.randint(5, 20)
-        pygame.draw.line(scanline_surface, (0, 0, 0, alpha), (0, y), (WIDTH, y), 1)
-    surface.blit(scanline_surface, (0, 0))
+def random_boot_line():
+    """Random boot text weighted toward MOTHER-style characters"""
+    system_chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    line_parts = []
+    line_length = random.randint(8, 50)
+    
+    # Build line with chunks of different character types
+    i = 0
+    while i < line_length:
+        chunk_type = random.choice(['system', 'special', 'space'])
+        if chunk_type == 'system':
+            chunk_len = random.randint(2, 8)
+            line_parts.append("".join(random.choice(system_chars) for _ in range(chunk_len)))
+            i += chunk_len
+        elif chunk_type == 'special':
+            chunk_len = random.randint(3, 15)
+            line_parts.append(random.choice(['_', '-', '=']) * chunk_len)
+            i += chunk_len
+        else:
+            line_parts.append(" " * random.randint(1, 3))
+            i += random.randint(1, 3)
+    
+    return "".join(line_parts)[:line_length]
 
-def flicker_effect(surface, intensity):
-    """Apply screen flicker"""
-    if intensity > 0:
-        flicker_overlay = pygame.Surface((WIDTH, HEIGHT))
-        flicker_overlay.fill((0, 0, 0))
-        flicker_overlay.set_alpha(intensity)
-        surface.blit(flicker_overlay, (0, 0))
+def build_boot_line_pool():
+    """Pre-render the boot line surfaces, one per warm-up slice"""
+    _, _, font_small = load_fonts()
+    pool = []
+    for _ in range(BOOT_POOL_SIZE):
+        color = random.choice([TERMINAL_GREEN, BRIGHT_GREEN, DIM_GREEN])
+        pool.append(font_small.render(random_boot_line(), True, color).convert_alpha())
+        yield
+    return pool
 
-def draw_glitch_text(surface, text, x, y, font, base_color):
-    """Draw text with glitch offset effect"""
-    # Draw offset "ghost" copies
-    offsets = [(-2, -2), (2, 2), (-3, 1)]
-    for offset_x, offset_y in offsets:
-        if random.random() < 0.7:
-            ghost_color = (0, random.randint(100, 200), 0)
-            ghost_surface = font.render(text, True, ghost_color)
-            surface.blit(ghost_surface, (x + offset_x, y + offset_y))
-    
-    # Draw main text
-    text_surface = font.render(text, True, base_color)
-    surface.blit(text_surface, (x, y))
+def boot_lines(pool):
+    """Endless stream of (surface, x, y) for new boot lines"""
+    while True:
+        yield (random.choice(pool),
+               random.randint(0, WIDTH - 600),
+               random.randint(20, HEIGHT - 40))
 
 def boot_sequence(screen):
     """MOTHER computer boot sequence with random characters and lines"""
-    font_large, font_medium, font_small = load_fonts()
     clock = pygame.time.Clock()
+    new_lines = boot_lines(warmup.get("boot_lines", build_boot_line_pool))
     
-    # Character sets weighted toward MOTHER-style characters
-    system_chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-    special_chars = "________----====||||"
-    boot_lines = []
-    max_lines = 35
+    # Live lines in a fixed ring buffer; a slot is free once its fade reaches 0.
+    # Lines all fade at the same rate, so the next slot always holds the oldest.
+    line_surfaces = [None] * BOOT_MAX_LINES
+    line_x = array('h', [0] * BOOT_MAX_LINES)
+    line_y = array('h', [0] * BOOT_MAX_LINES)
+    line_fade = array('B', [0] * BOOT_MAX_LINES)
+    next_slot = 0
     
     start_time = time.time()
     boot_duration = 3.0  # 3 seconds of boot sequence
@@ -71,51 +86,18 @@ def boot_sequence(screen):
         
         screen.fill(TERMINAL_BLACK)
         
-        # Add new random lines
-        if random.random() < 0.5 and len(boot_lines) < max_lines:
-            # Mix of system text and special characters
-            line_parts = []
-            line_length = random.randint(8, 50)
-            
-            # Build line with chunks of different character types
-            i = 0
-            while i < line_length:
-                chunk_type = random.choice(['system', 'special', 'space'])
-                if chunk_type == 'system':
-                    chunk_len = random.randint(2, 8)
-                    line_parts.append("".join(random.choice(system_chars) for _ in range(chunk_len)))
-                    i += chunk_len
-                elif chunk_type == 'special':
-                    chunk_len = random.randint(3, 15)
-                    line_parts.append(random.choice(['_', '-', '=']) * chunk_len)
-                    i += chunk_len
-                else:
-                    line_parts.append(" " * random.randint(1, 3))
-                    i += random.randint(1, 3)
-            
-            line_text = "".join(line_parts)[:line_length]
-            x_pos = random.randint(0, WIDTH - 600)
-            y_pos = random.randint(20, HEIGHT - 40)
-            boot_lines.append({
-                'text': line_text,
-                'x': x_pos,
-                'y': y_pos,
-                'alpha': 255,
-                'color': random.choice([TERMINAL_GREEN, BRIGHT_GREEN, DIM_GREEN])
-            })
+        # Add a new line if the ring has room
+        if random.random() < 0.5 and line_fade[next_slot] == 0:
+            line_surfaces[next_slot], line_x[next_slot], line_y[next_slot] = next(new_lines)
+            line_fade[next_slot] = 255
+            next_slot = (next_slot + 1) % BOOT_MAX_LINES
         
-        # Draw all boot lines
-        for line in boot_lines:
-            line_surface = font_small.render(line['text'], True, line['color'])
-            jitter_x = line['x'] + random.randint(-3, 3)
-            jitter_y = line['y'] + random.randint(-1, 1)
-            screen.blit(line_surface, (jitter_x, jitter_y))
-            
-            # Fade out old lines
-            line['alpha'] = max(0, line['alpha'] - 3)
-        
-        # Remove fully faded lines
-        boot_lines = [line for line in boot_lines if line['alpha'] > 0]
+        # Draw all boot lines with jitter, fading old ones out
+        for slot in range(BOOT_MAX_LINES):
+            if line_fade[slot]:
+                screen.blit(line_surfaces[slot], (line_x[slot] + random.randint(-3, 3),
+                                                  line_y[slot] + random.randint(-1, 1)))
+                line_fade[slot] = max(0, line_fade[slot] - BOOT_FADE_STEP)
         
         # Draw random horizontal lines (more frequent and varied)
         for _ in range(random.randint(3, 8)):
@@ -131,8 +113,8 @@ def boot_sequence(screen):
             heavy_static_effect(screen, 20)
         
         scanline_effect(screen)
-        pygame.display.flip()
-        clock.tick(60)
+        display.present(screen)
+        clock.tick(pacing.frame_cap)
     
     # Flash to indicate boot complete
     green_flash(screen)
@@ -140,21 +122,11 @@ def boot_sequence(screen):
 
 def run_title_sequence(screen):
     """Run the title sequence animation"""
-    font_large, font_medium, font_small = load_fonts()
-    
-    # Create even larger font for title
-    try:
-        from config import get_resource_path
-        title_font_path = get_resource_path("assets/VT323-Regular.ttf")
-        title_font = pygame.font.Font(title_font_path, 72)
-    except:
-        title_font = pygame.font.Font(None, 72)
-
-
-    # try:
-    #     title_font = pygame.font.Font("assets/VT323-Regular.ttf", 72)
-    # except:
-    #     title_font = pygame.font.Font(None, 72)
+    with startup.measure("fonts"):
+        font_large, font_medium, font_small = load_fonts()
+        
+        # Create even larger font for title
+        title_font = load_font(72)
     
     clock = pygame.time.Clock()
     
@@ -175,8 +147,10 @@ def run_title_sequence(screen):
         heavy_static_effect(screen, 300)
         scanline_effect(screen)
         
-        pygame.display.flip()
-        clock.tick(60)
+        display.present(screen)
+        startup.first_frame()
+        warmup.step()
+        clock.tick(pacing.frame_cap)
     
     green_flash(screen)
     
@@ -204,21 +178,20 @@ def run_title_sequence(screen):
             heavy_static_effect(screen, int(100 * (1 - progress)))
         
         # Draw "ALIEN:" with glitch effect
-        alien_text = "/\LIEN:"
-        alien_surface = title_font.render(alien_text, True, TERMINAL_GREEN)
-        alien_rect = alien_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
+        alien_text = glitch_text("/\LIEN:", title_font, TERMINAL_GREEN)
+        alien_rect = alien_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
         
         if random.random() < 0.8:
-            draw_glitch_text(screen, alien_text, alien_rect.x, alien_rect.y, 
-                           title_font, TERMINAL_GREEN)
+            alien_text.draw(screen, alien_rect.x, alien_rect.y)
         
         # Flicker effect
         if random.random() < 0.1:
             flicker_effect(screen, random.randint(10, 40))
         
         scanline_effect(screen)
-        pygame.display.flip()
-        clock.tick(60)
+        display.present(screen)
+        warmup.step()
+        clock.tick(pacing.frame_cap)
     
     green_flash(screen)
     
@@ -252,31 +225,30 @@ def run_title_sequence(screen):
             heavy_static_effect(screen, 30)
         
         # Draw "ALIEN:"
-        alien_text = "/\LIEN:"
-        alien_surface = title_font.render(alien_text, True, TERMINAL_GREEN)
-        alien_rect = alien_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
-        screen.blit(alien_surface, alien_rect)
+        alien_text = glitch_text("/\LIEN:", title_font, TERMINAL_GREEN)
+        alien_rect = alien_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
+        screen.blit(alien_text.surface, alien_rect)
         
         # Draw partially revealed "MUTHUR"
-        muthur_text = "".join(muthur_chars[:revealed_chars])
-        if muthur_text:
-            muthur_surface = title_font.render(muthur_text, True, TERMINAL_GREEN)
-            muthur_rect = muthur_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 30))
+        muthur_chars_shown = "".join(muthur_chars[:revealed_chars])
+        if muthur_chars_shown:
+            muthur_text = glitch_text(muthur_chars_shown, title_font, TERMINAL_GREEN)
+            muthur_rect = muthur_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 30))
             
             # Add glitch to newly appearing letters
             if revealed_chars < len(muthur_chars) and random.random() < 0.5:
-                draw_glitch_text(screen, muthur_text, muthur_rect.x, muthur_rect.y,
-                               title_font, TERMINAL_GREEN)
+                muthur_text.draw(screen, muthur_rect.x, muthur_rect.y)
             else:
-                screen.blit(muthur_surface, muthur_rect)
+                screen.blit(muthur_text.surface, muthur_rect)
         
         # Random flicker
         if random.random() < 0.08:
             flicker_effect(screen, random.randint(5, 25))
         
         scanline_effect(screen)
-        pygame.display.flip()
-        clock.tick(60)
+        display.present(screen)
+        warmup.step()
+        clock.tick(pacing.frame_cap)
     
     green_flash(screen)
     
@@ -285,9 +257,17 @@ def run_title_sequence(screen):
     phase_duration = 2.0
     show_prompt = False
     
+    # The title is rendered once; only the prompt blink animates (2 Hz), so idle until a key
+    title_lines = []
+    for text, y in (("ALIEN:", HEIGHT // 2 - 50), ("MUTHUR", HEIGHT // 2 + 30)):
+        surface = title_font.render(text, True, TERMINAL_GREEN)
+        title_lines.append((surface, surface.get_rect(center=(WIDTH // 2, y))))
+    prompt_surface = font_small.render("PRESS ANY KEY TO INITIALIZE", True, DIM_GREEN)
+    prompt_rect = prompt_surface.get_rect(center=(WIDTH // 2, HEIGHT - 80))
+    pacer = FramePacer()
     waiting = True
     while waiting:
-        for event in pygame.event.get():
+        for event in pacer.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -305,23 +285,17 @@ def run_title_sequence(screen):
             heavy_static_effect(screen, 10)
         
         # Draw title
-        alien_surface = title_font.render("ALIEN:", True, TERMINAL_GREEN)
-        alien_rect = alien_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
-        screen.blit(alien_surface, alien_rect)
-        
-        muthur_surface = title_font.render("MUTHUR", True, TERMINAL_GREEN)
-        muthur_rect = muthur_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 30))
-        screen.blit(muthur_surface, muthur_rect)
+        for surface, rect in title_lines:
+            screen.blit(surface, rect)
         
         # Blinking prompt (only after hold period)
         if show_prompt and int(time.time() * 2) % 2 == 0:
-            prompt_surface = font_small.render("PRESS ANY KEY TO INITIALIZE", True, DIM_GREEN)
-            prompt_rect = prompt_surface.get_rect(center=(WIDTH // 2, HEIGHT - 80))
             screen.blit(prompt_surface, prompt_rect)
         
         scanline_effect(screen)
-        pygame.display.flip()
-        clock.tick(60)
+        display.present(screen)
+        warmup.step()
+        pacer.tick(animating=False)
     
     # Phase 5: Boot sequence
     boot_sequence(screen)
@@ -7,24 +7,10 @@ import sys
 import time
 import random
 from config import WIDTH, HEIGHT, TERMINAL_GREEN, BRIGHT_GREEN, DIM_GREEN, TERMINAL_BLACK, load_fonts
-
-def shutdown_static_effect(surface, intensity=200):
-    """Create static interference during shutdown"""
-    for _ in range(intensity):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT)
-        brightness = random.randint(50, 255)
-        color = (0, brightness, 0)
-        size = random.randint(1, 3)
-        pygame.draw.circle(surface, color, (x, y), size)
-
-def scanline_effect(surface):
-    """Draw horizontal scanlines across screen"""
-    scanline_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    for y in range(0, HEIGHT, 3):
-        alpha = random.randint(5, 20)
-        pygame.draw.line(scanline_surface, (0, 0, 0, alpha), (0, y), (WIDTH, y), 1)
-    surface.blit(scanline_surface, (0, 0))
+import display
+import effects
+import pacing
+from effects import heavy_static_effect, scanline_effect, flicker_effect
 
 def run_shutdown_sequence(screen):
     """MOTHER computer shutdown sequence with degrading text columns"""
@@ -37,7 +23,7 @@ def run_shutdown_sequence(screen):
     
     # Create text columns that will degrade
     columns = []
-    num_columns = 25
+    num_columns = max(1, effects.scaled(25))
     
     for i in range(num_columns):
         column = {
@@ -59,8 +45,11 @@ def run_shutdown_sequence(screen):
                 else:
                     line_parts.append(random.choice(special_chars))
             
+            text = "".join(line_parts)
             column['lines'].append({
-                'text': "".join(line_parts),
+                'text': text,
+                # Rasterised once at full green; fade and flicker use surface alpha
+                'surface': font_small.render(text, True, TERMINAL_GREEN).convert_alpha(),
                 'alpha': 255,
                 'y': random.randint(20, HEIGHT - 40)
             })
@@ -107,12 +96,11 @@ def run_shutdown_sequence(screen):
                     jitter_x = column['x'] + random.randint(-jitter_amount, jitter_amount)
                     jitter_y = line['y'] + random.randint(-jitter_amount // 2, jitter_amount // 2)
                     
-                    # Calculate color with alpha
+                    # Dim the pre-rendered line; over black this matches
+                    # rendering it in (0, 255 * alpha * flicker, 0)
                     alpha_factor = line['alpha'] / 255
-                    color_value = int(255 * alpha_factor * random.uniform(0.6, 1.0))
-                    color = (0, color_value, 0)
-                    
-                    text_surface = font_small.render(line['text'], True, color)
+                    text_surface = line['surface']
+                    text_surface.set_alpha(int(255 * alpha_factor * random.uniform(0.6, 1.0)))
                     screen.blit(text_surface, (jitter_x, jitter_y))
             
             # Check if column is dead
@@ -145,7 +133,7 @@ def run_shutdown_sequence(screen):
         
         # Increasing static as shutdown progresses
         if random.random() < 0.3:
-            shutdown_static_effect(screen, int(100 * progress))
+            heavy_static_effect(screen, int(100 * progress))
         
         # More frequent scanlines during shutdown
         if random.random() < 0.5:
@@ -153,17 +141,16 @@ def run_shutdown_sequence(screen):
         
         # Screen flicker increases near end
         if progress > 0.7 and random.random() < 0.15:
-            flicker_overlay = pygame.Surface((WIDTH, HEIGHT))
-            flicker_overlay.fill((0, 0, 0))
-            flicker_overlay.set_alpha(random.randint(20, 60))
-            screen.blit(flicker_overlay, (0, 0))
+            flicker_effect(screen, random.randint(20, 60))
         
-        pygame.display.flip()
-        clock.tick(60)
+        display.present(screen)
+        clock.tick(pacing.frame_cap)
     
     # Final fade to black
     fade_duration = 1.5
     fade_start = time.time()
+    dark_overlay = display.acquire((WIDTH, HEIGHT))
+    dark_overlay.fill((0, 0, 0))
     
     while time.time() - fade_start < fade_duration:
         for event in pygame.event.get():
@@ -177,18 +164,18 @@ def run_shutdown_sequence(screen):
         
         # Occasional flicker of static
         if random.random() < 0.1:
-            shutdown_static_effect(screen, int(20 * (1 - fade_progress)))
+            heavy_static_effect(screen, int(20 * (1 - fade_progress)))
         
         # Darken overlay
-        dark_overlay = pygame.Surface((WIDTH, HEIGHT))
-        dark_overlay.fill((0, 0, 0))
         dark_overlay.set_alpha(int(255 * fade_progress))
         screen.blit(dark_overlay, (0, 0))
         
-        pygame.display.flip()
-        clock.tick(60)
+        display.present(screen)
+        clock.tick(pacing.frame_cap)
+    
+    display.release(dark_overlay)
     
     # Hold on black for a moment
     screen.fill(TERMINAL_BLACK)
-    pygame.display.flip()
+    display.present(screen)
     time.sleep(1)
\ No newline at end of file
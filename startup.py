@@ -0,0 +1,79 @@
+"""
+Startup profiler for ALIEN: MUTHUR
+
+Records import time, font load time and time-to-first-frame from the moment
+main.py starts importing. With MUTHUR_STARTUP_CHECK set in the environment
+the game prints the report at the first frame and exits non-zero if any
+STARTUP_BUDGET_MS entry in config.py is exceeded (see startup_check.py).
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+CHECK_ENV = "MUTHUR_STARTUP_CHECK"
+
+PROCESS_START = time.perf_counter()
+
+# Name -> milliseconds. Marks are times since start, measures are durations.
+marks = {}
+measures = {}
+_first_frame_done = False
+
+def elapsed_ms():
+    return (time.perf_counter() - PROCESS_START) * 1000
+
+def mark(name):
+    """Record the time since start, once per name"""
+    marks.setdefault(name, elapsed_ms())
+
+@contextmanager
+def measure(name):
+    """Accumulate the duration of a block under name"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        measures[name] = measures.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+def timings():
+    """Budgeted timings: imports, fonts and first_frame, in milliseconds"""
+    result = {}
+    if "imports" in marks:
+        result["imports"] = marks["imports"]
+    if "fonts" in measures:
+        result["fonts"] = measures["fonts"]
+    if "first_frame" in marks:
+        result["first_frame"] = marks["first_frame"]
+    return result
+
+def over_budget(budget=None):
+    """List (name, actual_ms, budget_ms) for every timing over budget"""
+    if budget is None:
+        from config import STARTUP_BUDGET_MS
+        budget = STARTUP_BUDGET_MS
+    return [(name, actual, budget[name]) for name, actual in timings().items()
+            if name in budget and actual > budget[name]]
+
+def report():
+    lines = ["Startup profile (ms since launch):"]
+    for name, ms in sorted(marks.items(), key=lambda item: item[1]):
+        lines.append(f"  {name:<16} {ms:8.1f}")
+    lines.append("Durations (ms):")
+    for name, ms in measures.items():
+        lines.append(f"  {name:<16} {ms:8.1f}")
+    for name, actual, limit in over_budget():
+        lines.append(f"OVER BUDGET: {name} {actual:.1f} ms > {limit} ms")
+    return "\n".join(lines)
+
+def first_frame():
+    """Call after the first frame is presented"""
+    global _first_frame_done
+    if _first_frame_done:
+        return
+    _first_frame_done = True
+    mark("first_frame")
+    if os.environ.get(CHECK_ENV):
+        print(report())
+        sys.exit(1 if over_budget() else 0)
@@ -0,0 +1,263 @@
+"""
+Background asset warm-up for ALIEN: MUTHUR
+
+The title sequence animates for about 8.5 seconds and then waits for a key,
+while the later scenes used to build their state cold after the player had
+moved on. The scheduler spends that idle time building it ahead:
+
+    - pygame-free jobs (maze walls, airlock ship graph, scene imports) run
+      one after another on a worker thread
+    - pygame jobs (boot lines, fonts, dialogue line surfaces) run on the main thread in
+      small time slices, via step() once per frame
+    - once the player has given their name, the dialogue that uses it is laid
+      out and spliced together in the same slices during the next screens
+
+Scenes pick results up with get() (shared) or take() (single use). Asking
+for a job that has not finished waits for the worker or finishes the job on
+the spot, and a scene run on its own, or whose job failed, falls back to
+building cold.
+"""
+
+import inspect
+import threading
+import time
+from collections import deque
+import startup
+
+# Main-thread work per frame, small enough not to drop a 60 fps frame
+SLICE_MS = 2.0
+
+class WarmupScheduler:
+    """Runs warm-up jobs on a worker thread or in main-thread time slices"""
+    def __init__(self):
+        self.results = {}
+        self.failed = {}
+        self.ready = {}
+        self.thread_jobs = []
+        self.main_jobs = deque()
+        self.active = None
+        self.worker = None
+
+    def add(self, name, job, thread=False):
+        """Queue a job by name
+
+        Args:
+            name: Key the result is stored under
+            job: Callable returning the result. Main-thread jobs may be
+                 generator functions that yield between chunks and return
+                 the result.
+            thread: Run on the worker thread (job must not touch pygame)
+        """
+        self.ready[name] = threading.Event()
+        if thread:
+            self.thread_jobs.append((name, job))
+        else:
+            self.main_jobs.append((name, job))
+
+    def start(self):
+        """Start the worker thread for the pygame-free jobs"""
+        if self.thread_jobs and self.worker is None:
+            self.worker = threading.Thread(target=self.run_thread_jobs, daemon=True)
+            self.worker.start()
+
+    def run_thread_jobs(self):
+        for name, job in self.thread_jobs:
+            try:
+                result = job()
+            except Exception as error:
+                self.fail(name, error)
+                continue
+            self.finish(name, result)
+        startup.mark("warmup_thread_done")
+
+    def finish(self, name, result):
+        self.results[name] = result
+        self.ready[name].set()
+
+    def fail(self, name, error):
+        """Record a job that raised; get() then builds the result itself"""
+        print(f"Warm-up job {name!r} failed: {error!r}")
+        self.failed[name] = error
+        self.ready[name].set()
+
+    def step(self, budget_ms=SLICE_MS):
+        """Run main-thread jobs for up to budget_ms; call once per frame"""
+        deadline = time.perf_counter() + budget_ms / 1000
+        while self.main_jobs and time.perf_counter() < deadline:
+            name, job = self.main_jobs[0]
+            try:
+                if self.active is None:
+                    result = job()
+                    if not inspect.isgenerator(result):
+                        self.main_jobs.popleft()
+                        self.finish(name, result)
+                        continue
+                    self.active = result
+                next(self.active)
+            except StopIteration as done:
+                self.main_jobs.popleft()
+                self.active = None
+                self.finish(name, done.value)
+            except Exception as error:
+                self.main_jobs.popleft()
+                self.active = None
+                self.fail(name, error)
+        if not self.main_jobs and self.ready:
+            startup.mark("warmup_main_done")
+
+    def get(self, name, build=None):
+        """Result of a warm-up job, waiting for or finishing it if needed
+
+        Falls back to build() (or None) for jobs that were never scheduled,
+        whose worker never started or that raised; build may be a generator
+        function.
+        """
+        if name not in self.results:
+            if any(job_name == name for job_name, _ in self.main_jobs):
+                while name not in self.results and name not in self.failed:
+                    self.step(budget_ms=float("inf"))
+            elif self.worker is not None and name in self.ready:
+                self.ready[name].wait()
+        if name in self.results:
+            return self.results[name]
+        return complete(build()) if build else None
+
+    def take(self, name, build=None):
+        """Like get(), but hand the result over so it is never shared"""
+        result = self.get(name, build)
+        self.results.pop(name, None)
+        self.failed.pop(name, None)
+        self.ready.pop(name, None)
+        return result
+
+def complete(result):
+    """Run a generator job to the end and return its result"""
+    if not inspect.isgenerator(result):
+        return result
+    try:
+        while True:
+            next(result)
+    except StopIteration as done:
+        return done.value
+
+_scheduler = WarmupScheduler()
+
+def add(name, job, thread=False):
+    _scheduler.add(name, job, thread)
+
+def start():
+    _scheduler.start()
+
+def step(budget_ms=SLICE_MS):
+    _scheduler.step(budget_ms)
+
+def get(name, build=None):
+    return _scheduler.get(name, build)
+
+def take(name, build=None):
+    return _scheduler.take(name, build)
+
+
+NAME_FIELD = "{player_name}"
+
+def dialogue_lines(block, named=False):
+    """Every line in a dialogue block that does (named) or does not use the player name"""
+    if isinstance(block, str):
+        if (NAME_FIELD in block) == named:
+            yield block
+    elif isinstance(block, dict):
+        for value in block.values():
+            yield from dialogue_lines(value, named)
+    else:
+        for value in block:
+            yield from dialogue_lines(value, named)
+
+def named_blocks(block):
+    """Every list of lines in a dialogue block that uses the player name"""
+    if isinstance(block, dict):
+        for value in block.values():
+            yield from named_blocks(value)
+    elif not isinstance(block, str) and any(NAME_FIELD in line for line in block):
+        yield block
+
+def dialogue_script():
+    from scenes import dialogue
+    return (dialogue.OPENING_DIALOGUE, dialogue.MAZE_DIALOGUE,
+            dialogue.NAVIGATION_DIALOGUE, dialogue.AIRLOCK_DIALOGUE,
+            dialogue.VICTORY_DIALOGUE)
+
+def prerender_dialogue():
+    """Render the fixed dialogue lines, as wrapped, into the engine's line cache, one per slice"""
+    from config import WIDTH, TERMINAL_GREEN, load_fonts
+    from engine import render_line
+    from layout import MARGIN, wrap
+    font_large, _, _ = load_fonts()
+    count = 0
+    for block in dialogue_script():
+        for line in dialogue_lines(block):
+            for piece in wrap(font_large, line, WIDTH - 2 * MARGIN):
+                render_line(font_large, piece, TERMINAL_GREEN)
+                count += 1
+                yield
+    return count
+
+def prerender_templates():
+    """Render the fixed text around {player_name} in the named lines, one run per slice"""
+    from config import TERMINAL_GREEN, load_fonts
+    from engine import render_line
+    font_large, _, _ = load_fonts()
+    for block in dialogue_script():
+        for line in dialogue_lines(block, named=True):
+            for part in line.split(NAME_FIELD):
+                render_line(font_large, part, TERMINAL_GREEN)
+                yield
+
+def prerender_named_dialogue(player_name):
+    """Lay out and render the named dialogue once the name is known, one line per slice
+
+    Lines that fit the screen are spliced from the template runs and one
+    rendering of the name; lines the name pushes into wrapping are rendered
+    piece by piece.
+    """
+    from config import TERMINAL_GREEN, load_fonts
+    from engine import render_line, splice_line
+    from layout import block_pages
+    font_large, _, _ = load_fonts()
+    count = 0
+    for script_block in dialogue_script():
+        for block in named_blocks(script_block):
+            for page in block_pages(block, font_large, player_name):
+                for line in page:
+                    template = block[line.source]
+                    if NAME_FIELD not in template:
+                        continue  # Fixed lines are pre-rendered at startup
+                    if line.text == template.format(player_name=player_name):
+                        splice_line(font_large, template.split(NAME_FIELD), player_name, TERMINAL_GREEN)
+                    else:
+                        render_line(font_large, line.text, TERMINAL_GREEN)
+                    count += 1
+                    yield
+    return count
+
+def schedule_player_dialogue(player_name):
+    """Queue the named dialogue for the main-thread slices of the next screens"""
+    add("named_dialogue", lambda: prerender_named_dialogue(player_name))
+
+def load_game_fonts():
+    from config import load_font, load_fonts
+    return load_fonts() + (load_font(72),)
+
+def schedule_game_assets(scene_imports=None):
+    """Queue the warm-up jobs for the scenes after the title and start the worker"""
+    from maze_model import create_maze_walls
+    from airlock_sim import build_ship
+    from scenes.title import build_boot_line_pool
+    add("maze_walls", create_maze_walls, thread=True)
+    add("airlock_ship", build_ship, thread=True)
+    if scene_imports:
+        add("scene_imports", scene_imports, thread=True)
+    add("boot_lines", build_boot_line_pool)
+    add("fonts", load_game_fonts)
+    add("dialogue", prerender_dialogue)
+    add("dialogue_templates", prerender_templates)
+    start()
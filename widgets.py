@@ -0,0 +1,120 @@
+"""
+Retained-mode text widgets for ALIEN: MUTHUR
+
+Terminal-style text that keeps its rendered surfaces between frames and
+re-rasterises only what changed: a label, a list of log lines, and a text
+field with a cursor glyph. Used by the name prompt and the airlock terminal.
+"""
+
+from contextlib import contextmanager
+import pygame
+
+# Key repeat while a text field has focus, in milliseconds
+KEY_REPEAT_DELAY = 400
+KEY_REPEAT_INTERVAL = 40
+
+@contextmanager
+def key_repeat(delay=KEY_REPEAT_DELAY, interval=KEY_REPEAT_INTERVAL):
+    """Enable key repeat for a block, restoring the previous setting after"""
+    previous = pygame.key.get_repeat()
+    pygame.key.set_repeat(delay, interval)
+    try:
+        yield
+    finally:
+        pygame.key.set_repeat(*previous)
+
+class TextLabel:
+    """A line of text rendered only when its text changes"""
+    def __init__(self, font, color, text=""):
+        self.font = font
+        self.color = color
+        self.text = None
+        self.surface = None
+        self.set(text)
+
+    def set(self, text):
+        if text != self.text:
+            self.text = text
+            self.surface = self.font.render(text, True, self.color)
+
+    def draw(self, surface, position):
+        """Blit the label (nothing for empty text); returns its width"""
+        if self.text:
+            surface.blit(self.surface, position)
+        return self.surface.get_width()
+
+class LineCache:
+    """Rendered surfaces for a changing list of lines
+
+    Lines are cached by text, so scrolling a log renders only the new line.
+    """
+    def __init__(self, font, color):
+        self.font = font
+        self.color = color
+        self.surfaces = {}
+
+    def render(self, lines):
+        """Surfaces for lines, in order, dropping lines no longer shown"""
+        surfaces = {}
+        for line in lines:
+            if line not in surfaces:
+                surfaces[line] = self.surfaces.get(line) or self.font.render(line, True, self.color)
+        self.surfaces = surfaces
+        return [surfaces[line] for line in lines]
+
+    def draw(self, surface, lines, x, y, line_height):
+        for i, line_surface in enumerate(self.render(lines)):
+            surface.blit(line_surface, (x, y + i * line_height))
+
+class TextField:
+    """Single-line text input with a cached rendering and cursor glyph
+
+    Args:
+        font: Font for the text
+        color: Text color
+        prefix: Fixed text before the input, e.g. '> '
+        max_length: Longest accepted input, or None for no limit
+        cursor: Cursor glyph, drawn after the text
+        blink_ms: Cursor blink half-period, or None for a steady cursor
+    """
+    def __init__(self, font, color, prefix="", max_length=None, cursor="_", blink_ms=None):
+        self.prefix = prefix
+        self.max_length = max_length
+        self.blink_ms = blink_ms
+        self.text = ""
+        self.label = TextLabel(font, color, prefix)
+        self.cursor = font.render(cursor, True, color)
+
+    def set_text(self, text):
+        self.text = text
+        self.label.set(self.prefix + text)
+
+    def handle_event(self, event):
+        """Apply a KEYDOWN event
+
+        Returns:
+            "submit" for Enter, "edit" if the text changed, otherwise None
+        """
+        if event.type != pygame.KEYDOWN:
+            return None
+        if event.key == pygame.K_RETURN:
+            return "submit"
+        if event.key == pygame.K_BACKSPACE:
+            self.set_text(self.text[:-1])
+            return "edit"
+        if event.unicode.isprintable() and (self.max_length is None or len(self.text) < self.max_length):
+            self.set_text(self.text + event.unicode)
+            return "edit"
+        return None
+
+    def submit(self):
+        """Return the text and clear the field"""
+        text = self.text
+        self.set_text("")
+        return text
+
+    def draw(self, surface, position):
+        x, y = position
+        width = self.label.draw(surface, position)
+        if self.blink_ms is None or (pygame.time.get_ticks() // self.blink_ms) % 2 == 0:
+            surface.blit(self.cursor, (x + width, y))